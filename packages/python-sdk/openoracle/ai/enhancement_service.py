@@ -124,9 +124,8 @@ class EnhancementService:
                     result = response.json()
                     ai_content = result["choices"][0]["message"]["content"]
                     
-                    # Parse and validate AI response
-                    ai_data = json.loads(ai_content)
-                    ai_enhancement = AIEnhancementResponse.model_validate(ai_data)
+                    # Parse and validate AI response in one pass
+                    ai_enhancement = AIEnhancementResponse.model_validate_json(ai_content)
                     
                     # Apply AI enhancements to basic response
                     return self._apply_enhancements(basic_response, ai_enhancement)
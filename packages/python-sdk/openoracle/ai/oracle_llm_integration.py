@@ -137,7 +137,8 @@ Select the optimal oracle provider and provide detailed reasoning."""
             # Additional validation - ensure selected oracle is in available providers
             if oracle_response.selected_oracle not in provider_enums:
                 # Fallback to first available provider
-                oracle_response.selected_oracle = provider_enums[0]
+                # selected_oracle holds the provider name; assignment isn't validated
+                oracle_response.selected_oracle = provider_enums[0].value
                 oracle_response.reasoning += f" (Fallback selection as original choice was unavailable)"
                 oracle_response.confidence *= 0.8  # Reduce confidence due to fallback
             
@@ -146,10 +147,10 @@ Select the optimal oracle provider and provide detailed reasoning."""
         except Exception as e:
             # Fallback response if validation fails
             return OracleRoutingResponse(
-                selected_oracle=provider_enums[0],
+                selected_oracle=provider_enums[0].value,
                 reasoning=f"Fallback selection due to parsing error: {str(e)}",
                 confidence=0.5,
-                fallback_options=provider_enums[1:3] if len(provider_enums) > 1 else []
+                fallback_options=[provider.value for provider in provider_enums[1:3]]
             )
     
     async def resolve_prediction_market(
@@ -9,7 +9,8 @@ from typing import Dict, Any, Optional
 import httpx
 
 from ..schemas.oracle_schemas import (
-    OracleProvider, DataCategory, OracleRoutingRequest, OracleRoutingResponse
+    OracleProvider, DataCategory, OracleRoutingRequest, OracleRoutingResponse,
+    PROVIDER_VALUES, CATEGORY_VALUES
 )
 
 logger = logging.getLogger(__name__)
@@ -183,19 +184,15 @@ Make your best judgment based on the question content and oracle capabilities.
         
         try:
             # Parse oracle provider
-            oracle_str = ai_data.get("selected_oracle", "").upper()
+            oracle_str = ai_data.get("selected_oracle", "").lower()
             selected_oracle = None
-            if oracle_str in ["CHAINLINK", "PYTH", "UMA", "BAND", "API3"]:
+            if oracle_str in PROVIDER_VALUES:
                 selected_oracle = OracleProvider(oracle_str)
             
             # Parse data category
-            category_str = ai_data.get("data_type", "").upper()
+            category_str = ai_data.get("data_type", "").lower()
             data_type = None
-            valid_categories = [
-                "PRICE", "SPORTS", "WEATHER", "ELECTION", "ECONOMIC", 
-                "CUSTOM", "EVENTS", "NFT", "STOCKS", "FOREX", "COMMODITIES", "RANDOM"
-            ]
-            if category_str in valid_categories:
+            if category_str in CATEGORY_VALUES:
                 data_type = DataCategory(category_str)
             
             return OracleRoutingResponse(
@@ -307,7 +304,9 @@ Apply your specialized knowledge to make the best oracle selection for this ques
             result = await original_router.route_question(request)
             # Add agent info to reasoning
             if result.reasoning:
-                result.reasoning = f"[{agent_type.upper()}] {result.reasoning}"
+                result = result.model_copy(
+                    update={'reasoning': f"[{agent_type.upper()}] {result.reasoning}"}
+                )
             return result
         finally:
             # Restore original method
@@ -628,11 +628,11 @@ class EnhancedAIRoutingService:
                 
                 if response.status_code == 200:
                     result = response.json()
-                    ai_data = json.loads(result["choices"][0]["message"]["content"])
+                    ai_content = result["choices"][0]["message"]["content"]
                     
                     # Parse AI response with Pydantic model validation
                     try:
-                        ai_enhancement = AIEnhancementResponse.model_validate(ai_data)
+                        ai_enhancement = AIEnhancementResponse.model_validate_json(ai_content)
                         
                         # Create new response with enhanced data
                         return OracleRoutingResponse(
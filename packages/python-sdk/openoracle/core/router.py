@@ -3,9 +3,10 @@ Main OpenOracle Router Class
 Central interface for oracle routing and data retrieval
 """
 
+import asyncio
 import logging
 from typing import Dict, Any, List, Optional, Union
-from datetime import datetime
+from datetime import datetime, timezone
 from decimal import Decimal
 
 from .config import OracleConfig, get_config
@@ -18,7 +19,8 @@ from ..schemas.oracle_schemas import (
     OracleRoutingResponse,
     OracleDataPoint,
     OraclePollData,
-    AggregatedOracleData
+    AggregatedOracleData,
+    aggregate_values
 )
 from ..providers.chainlink import ChainlinkProvider
 from ..providers.pyth import PythProvider
@@ -26,12 +28,43 @@ from ..api.client import OpenOracleAPI
 
 logger = logging.getLogger(__name__)
 
+# Exact numeric types for aggregation; bool is deliberately excluded
+_NUMERIC = (int, float)
+
+# Price params name the asset under a provider-specific key
+_ASSET_KEYS = ('pair', 'symbol')
+
+
+def _shared_asset_params(params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Params naming one asset under every provider's key, or None if no asset is named"""
+    asset = next((params[key] for key in _ASSET_KEYS if params.get(key)), None)
+    if asset is None:
+        return None
+    return {**params, 'pair': asset, 'symbol': asset}
+
+# Trust boundary: data points assembled here come from our own providers,
+# which already normalize their fields, so they are built with
+# model_construct. Aggregates are validated so check_discrepancy runs and
+# the aggregation method is checked; there is one per call.
+
 class OpenOracleRouter:
     """
     Main class for intelligent oracle routing
     Provides a unified interface for all oracle operations
+    
+    Providers keep pooled HTTP sessions open once used. Use the router as
+    ``async with OpenOracleRouter() as router:`` or await ``router.close()``
+    to release them.
     """
     
+    # Resolution criteria appended per data category
+    _CRITERIA_SUFFIX = {
+        DataCategory.PRICE: "Resolution occurs when price threshold is crossed or timeframe expires.",
+        DataCategory.SPORTS: "Resolution occurs when game result is finalized.",
+        DataCategory.EVENTS: "Resolution occurs when event outcome is confirmed."
+    }
+    _DEFAULT_SUFFIX = "Resolution based on oracle data availability and consensus."
+    
     def __init__(
         self,
         openrouter_api_key: Optional[str] = None,
@@ -60,6 +93,28 @@ class OpenOracleRouter:
             # Add other providers as implemented
         }
         
+        # (provider, data type) -> handler taking request params
+        self._dispatch = {
+            (OracleProvider.CHAINLINK, DataCategory.PRICE): self._chainlink_price,
+            (OracleProvider.CHAINLINK, DataCategory.SPORTS): self._chainlink_sports,
+            (OracleProvider.PYTH, DataCategory.PRICE): self._pyth_price,
+        }
+    
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.close()
+    
+    async def close(self):
+        """Close provider HTTP sessions"""
+        for provider in self.providers.values():
+            close = getattr(provider, "close", None)
+            if close is not None:
+                await close()
+        
     async def route_poll_question(
         self,
         question: str,
@@ -111,42 +166,102 @@ class OpenOracleRouter:
         Returns:
             OracleDataPoint with the requested data
         """
-        oracle_provider = self.providers.get(provider)
-        if not oracle_provider:
+        if provider not in self.providers:
             logger.error(f"Provider {provider} not implemented")
             return None
         
+        handler = self._dispatch.get((provider, data_type))
+        if handler is None:
+            return None
+        
         try:
-            if provider == OracleProvider.CHAINLINK:
-                if data_type == DataCategory.PRICE:
-                    feed = await oracle_provider.get_price_feed(params.get('pair', 'ETH/USD'))
-                    if feed:
-                        return await oracle_provider.to_oracle_data_point(feed)
-                elif data_type == DataCategory.SPORTS:
-                    data = await oracle_provider.get_sports_data(
-                        params.get('sport', 'NFL'),
-                        params.get('game_id', '')
-                    )
-                    if data:
-                        return OracleDataPoint(
-                            provider=provider,
-                            data_type=data_type,
-                            value=data,
-                            timestamp=datetime.utcnow(),
-                            confidence=0.95
-                        )
-                        
-            elif provider == OracleProvider.PYTH:
-                if data_type == DataCategory.PRICE:
-                    feed = await oracle_provider.get_price_feed(params.get('symbol', 'BTC/USD'))
-                    if feed:
-                        return await oracle_provider.to_oracle_data_point(feed)
-                        
+            return await handler(params)
         except Exception as e:
             logger.error(f"Failed to get oracle data: {e}")
             
         return None
     
+    async def _chainlink_price(self, params: Dict[str, Any]) -> Optional[OracleDataPoint]:
+        """Fetch a Chainlink price feed as a data point"""
+        chainlink = self.providers[OracleProvider.CHAINLINK]
+        feed = await chainlink.get_price_feed(params.get('pair', 'ETH/USD'))
+        if feed:
+            return await chainlink.to_oracle_data_point(feed)
+        return None
+    
+    async def _chainlink_sports(self, params: Dict[str, Any]) -> Optional[OracleDataPoint]:
+        """Fetch a Chainlink sports result as a data point"""
+        data = await self.providers[OracleProvider.CHAINLINK].get_sports_data(
+            params.get('sport', 'NFL'),
+            params.get('game_id', '')
+        )
+        if data:
+            return OracleDataPoint.model_construct(
+                provider=OracleProvider.CHAINLINK,
+                data_type=DataCategory.SPORTS,
+                value=data,
+                timestamp=datetime.now(timezone.utc),
+                confidence=0.95
+            )
+        return None
+    
+    async def _pyth_price(self, params: Dict[str, Any]) -> Optional[OracleDataPoint]:
+        """Fetch a Pyth price feed as a data point"""
+        pyth = self.providers[OracleProvider.PYTH]
+        feed = await pyth.get_price_feed(params.get('symbol', 'BTC/USD'))
+        if feed:
+            return await pyth.to_oracle_data_point(feed)
+        return None
+    
+    async def get_oracle_data_fastest(
+        self,
+        data_type: DataCategory,
+        params: Dict[str, Any],
+        providers: List[OracleProvider]
+    ) -> Optional[OracleDataPoint]:
+        """
+        Query providers concurrently and return the first valid response
+        
+        Every provider is asked for the same asset. If params don't name one
+        ('pair' or 'symbol'), each provider would fall back to its own default
+        asset, so only the first provider is queried.
+        
+        Args:
+            data_type: Type of data to retrieve
+            params: Parameters for data retrieval
+            providers: Providers to race against each other
+            
+        Returns:
+            First non-empty OracleDataPoint, or None if every provider fails
+        """
+        if len(providers) > 1:
+            shared = _shared_asset_params(params)
+            if shared is None:
+                providers = providers[:1]
+            else:
+                params = shared
+        
+        pending = {
+            asyncio.create_task(self.get_oracle_data(provider, data_type, params))
+            for provider in providers
+        }
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    result = task.result()
+                    if result is not None:
+                        return result
+            return None
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                # Reap the losers so none finishes unawaited
+                await asyncio.gather(*pending, return_exceptions=True)
+    
     async def get_aggregated_data(
         self,
         data_type: DataCategory,
@@ -171,30 +286,22 @@ class OpenOracleRouter:
             else:
                 providers = [OracleProvider.CHAINLINK]
         
-        data_points = []
-        individual_values = {}
-        
-        for provider in providers:
-            data_point = await self.get_oracle_data(provider, data_type, params)
-            if data_point:
-                data_points.append(data_point)
-                individual_values[provider.value] = data_point.value
+        results = await asyncio.gather(
+            *(self.get_oracle_data(p, data_type, params) for p in providers)
+        )
+        data_points = [dp for dp in results if dp]
+        individual_values = {
+            p.value: dp.value for p, dp in zip(providers, results) if dp
+        }
         
         if not data_points:
             return None
         
         # Calculate aggregated value (median for numeric data)
-        if all(isinstance(dp.value, (int, float)) for dp in data_points):
-            values = sorted([dp.value for dp in data_points])
-            if len(values) % 2 == 0:
-                median_value = (values[len(values)//2 - 1] + values[len(values)//2]) / 2
-            else:
-                median_value = values[len(values)//2]
-            
-            # Check for discrepancies (>5% difference)
-            max_val = max(values)
-            min_val = min(values)
-            discrepancy = (max_val - min_val) / max_val > 0.05 if max_val > 0 else False
+        if all(type(dp.value) in _NUMERIC for dp in data_points):
+            median_value, discrepancy = aggregate_values(
+                [dp.value for dp in data_points], "median"
+            )
             
             return AggregatedOracleData(
                 data_type=data_type,
@@ -202,7 +309,7 @@ class OpenOracleRouter:
                 aggregation_method="median",
                 aggregated_value=median_value,
                 individual_values=individual_values,
-                timestamp=datetime.utcnow(),
+                timestamp=datetime.now(timezone.utc),
                 confidence=0.95 if not discrepancy else 0.8,
                 discrepancy_detected=discrepancy
             )
@@ -224,7 +331,8 @@ class OpenOracleRouter:
         self,
         question: str,
         poll_id: str,
-        auto_resolve: bool = True
+        auto_resolve: bool = True,
+        max_latency_ms: Optional[int] = None
     ) -> Optional[OraclePollData]:
         """
         Create a poll with oracle backing for automatic resolution
@@ -233,12 +341,17 @@ class OpenOracleRouter:
             question: The poll question
             poll_id: Unique identifier for the poll
             auto_resolve: Whether to automatically resolve when data is available
+            max_latency_ms: Maximum acceptable latency; when set, the selected
+                oracle and its alternatives are raced for the initial data
             
         Returns:
             OraclePollData with oracle configuration
         """
         # Route the question to find appropriate oracle
-        routing_response = await self.route_poll_question(question)
+        routing_response = await self.route_poll_question(
+            question,
+            max_latency_ms=max_latency_ms
+        )
         
         if not routing_response.can_resolve:
             logger.warning(f"Cannot create oracle-backed poll: {routing_response.reasoning}")
@@ -247,11 +360,24 @@ class OpenOracleRouter:
         # Get initial oracle data if available
         initial_data = []
         if routing_response.selected_oracle and routing_response.oracle_config:
-            data_point = await self.get_oracle_data(
-                routing_response.selected_oracle,
-                routing_response.data_type or DataCategory.CUSTOM,
-                routing_response.oracle_config
-            )
+            data_type = routing_response.data_type or DataCategory.CUSTOM
+            if max_latency_ms:
+                candidates = [routing_response.selected_oracle]
+                candidates.extend(
+                    p for p in routing_response.alternatives or []
+                    if p not in candidates
+                )
+                data_point = await self.get_oracle_data_fastest(
+                    data_type,
+                    routing_response.oracle_config,
+                    candidates
+                )
+            else:
+                data_point = await self.get_oracle_data(
+                    routing_response.selected_oracle,
+                    data_type,
+                    routing_response.oracle_config
+                )
             if data_point:
                 initial_data.append(data_point)
         
@@ -276,18 +402,10 @@ class OpenOracleRouter:
     ) -> str:
         """Build resolution criteria based on question and routing"""
         
-        criteria = f"Poll resolves based on {routing.selected_oracle.value} oracle data. "
-        
-        if routing.data_type == DataCategory.PRICE:
-            criteria += "Resolution occurs when price threshold is crossed or timeframe expires."
-        elif routing.data_type == DataCategory.SPORTS:
-            criteria += "Resolution occurs when game result is finalized."
-        elif routing.data_type == DataCategory.EVENTS:
-            criteria += "Resolution occurs when event outcome is confirmed."
-        else:
-            criteria += "Resolution based on oracle data availability and consensus."
-        
-        return criteria
+        return (
+            f"Poll resolves based on {routing.selected_oracle.value} oracle data. "
+            + self._CRITERIA_SUFFIX.get(routing.data_type, self._DEFAULT_SUFFIX)
+        )
     
     async def resolve_poll(
         self,
@@ -311,7 +429,7 @@ class OpenOracleRouter:
                 'winning_option': 'Yes',
                 'oracle_value': 100.0,
                 'proof': '0x' + '0' * 64,
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': datetime.now(timezone.utc).isoformat()
             }
         
         return {
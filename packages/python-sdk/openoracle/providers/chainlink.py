@@ -2,11 +2,14 @@
 Chainlink Oracle Provider Implementation
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+import sys
+import time
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, timezone
 from decimal import Decimal
-import httpx
 
 from ..schemas.oracle_schemas import (
     ChainlinkPriceFeed,
@@ -23,8 +26,8 @@ logger = logging.getLogger(__name__)
 class ChainlinkProvider:
     """Chainlink oracle data provider"""
     
-    # Popular Chainlink price feed addresses on Ethereum mainnet
-    PRICE_FEEDS = {
+    # Popular Chainlink price feed addresses on Ethereum mainnet (read-only, interned keys)
+    PRICE_FEEDS = MappingProxyType({sys.intern(pair): address for pair, address in {
         'ETH/USD': '0x5f4eC3Df9cbd43714FE2740f5E3616155c5b8419',
         'BTC/USD': '0xF4030086522a5bEEa4988F8cA5B36dbC97BeE88c',
         'LINK/USD': '0x2c1d072e956AFFC0D435Cb7AC38EF18d24d9127c',
@@ -40,25 +43,51 @@ class ChainlinkProvider:
         'GOLD/USD': '0x214eD9Da11D2fbe465a6fc601a91E62EbEc1a0D6',
         'SILVER/USD': '0x379589227b15F1a12195D3f2d90bBc9F31f95235',
         'OIL/USD': '0xf3a9Fe08D6A20b85A2c7f3F7a6Ac8a7D3e6F5f8D'  # Example
-    }
+    }.items()})
+    
+    # Hot-path lookup bound once, reading the public table so the two never diverge
+    _feed_address_lookup = PRICE_FEEDS.get
     
     # Sports data feeds (conceptual - actual addresses would vary)
-    SPORTS_FEEDS = {
+    SPORTS_FEEDS = MappingProxyType({
         'NFL/SCORES': '0x0000000000000000000000000000000000000001',
         'NBA/SCORES': '0x0000000000000000000000000000000000000002',
         'MLB/SCORES': '0x0000000000000000000000000000000000000003'
-    }
+    })
     
     # Weather data feeds
-    WEATHER_FEEDS = {
+    WEATHER_FEEDS = MappingProxyType({
         'TEMP/NYC': '0x0000000000000000000000000000000000000010',
         'RAIN/LA': '0x0000000000000000000000000000000000000011'
-    }
+    })
     
-    def __init__(self, rpc_url: str = "https://eth-mainnet.g.alchemy.com/v2/"):
+    def __init__(
+        self,
+        rpc_url: str = "https://eth-mainnet.g.alchemy.com/v2/",
+        cache_ttl_s: float = 1.0,
+        max_concurrent_rpc: int = 10
+    ):
         self.rpc_url = rpc_url
         self.base_url = "https://api.chain.link"  # Chainlink API endpoint
         
+        # pair -> (monotonic fetch time, feed)
+        self._cache: Dict[str, Tuple[float, ChainlinkPriceFeed]] = {}
+        self._cache_ttl = cache_ttl_s
+        
+        # pair -> fully built feed; repeat fetches only refresh updated_at_ms
+        self._feed_templates: Dict[str, ChainlinkPriceFeed] = {}
+        
+        # Self-throttle RPC calls so caller fan-out can't trip provider rate limits;
+        # the semaphore is created on first use so it binds to the running loop
+        self._max_concurrent_rpc = max_concurrent_rpc
+        self._sem: Optional[asyncio.Semaphore] = None
+    
+    def _rpc_slots(self) -> asyncio.Semaphore:
+        """RPC concurrency limiter, created inside the running event loop"""
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self._max_concurrent_rpc)
+        return self._sem
+        
     async def get_price_feed(
         self,
         pair: str,
@@ -66,34 +95,51 @@ class ChainlinkProvider:
     ) -> Optional[ChainlinkPriceFeed]:
         """Get price feed data from Chainlink"""
         
-        try:
-            # In production, this would make actual RPC calls to the blockchain
-            # For now, return mock data
-            feed_address = self.PRICE_FEEDS.get(pair)
-            if not feed_address:
-                logger.error(f"Price feed not found for pair: {pair}")
-                return None
-            
-            # Mock response (in production, call the smart contract)
-            mock_price = self._get_mock_price(pair)
-            
-            return ChainlinkPriceFeed(
-                feed_id=feed_address,
-                pair=pair,
-                decimals=8,
-                latest_answer=mock_price,
-                updated_at=datetime.utcnow(),
-                round_id=12345678,
-                answered_in_round=12345678,
-                heartbeat=3600,
-                num_oracles=21,
-                aggregator_address=feed_address,
-                proxy_address=feed_address
-            )
+        entry = self._cache.get(pair)
+        if entry and time.monotonic() - entry[0] < self._cache_ttl:
+            return entry[1]
+        
+        # Placeholder: the limit wraps the mock build below and becomes the
+        # real guard once this path makes the on-chain RPC call
+        async with self._rpc_slots():
+            try:
+                # In production, this would make actual RPC calls to the blockchain
+                # For now, return mock data
+                template = self._feed_templates.get(pair)
+                if template is None:
+                    feed_address = self._feed_address_lookup(pair)
+                    if not feed_address:
+                        logger.error(f"Price feed not found for pair: {pair}")
+                        return None
+                
+                    # Mock response (in production, call the smart contract)
+                    mock_price = self._get_mock_price(pair)
+                
+                    # Fields are built locally, so skip validation
+                    feed = ChainlinkPriceFeed.model_construct(
+                        feed_id=feed_address,
+                        pair=pair,
+                        decimals=8,
+                        latest_answer_raw=int(mock_price.scaleb(8)),
+                        updated_at_ms=time.time_ns() // 1_000_000,
+                        round_id=12345678,
+                        answered_in_round=12345678,
+                        heartbeat=3600,
+                        num_oracles=21,
+                        aggregator_address=feed_address,
+                        proxy_address=feed_address
+                    )
+                    self._feed_templates[pair] = feed
+                else:
+                    feed = template.model_copy(
+                        update={'updated_at_ms': time.time_ns() // 1_000_000}
+                    )
+                self._cache[pair] = (time.monotonic(), feed)
+                return feed
             
-        except Exception as e:
-            logger.error(f"Failed to get Chainlink price feed: {e}")
-            return None
+            except Exception as e:
+                logger.error(f"Failed to get Chainlink price feed: {e}")
+                return None
     
     async def get_sports_data(
         self,
@@ -112,7 +158,7 @@ class ChainlinkProvider:
                 'home_score': 110,
                 'away_score': 105,
                 'status': 'final',
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': datetime.now(timezone.utc).isoformat()
             }
         except Exception as e:
             logger.error(f"Failed to get sports data: {e}")
@@ -132,7 +178,7 @@ class ChainlinkProvider:
                 'metric': metric,
                 'value': 72.5,
                 'unit': 'fahrenheit',
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': datetime.now(timezone.utc).isoformat()
             }
         except Exception as e:
             logger.error(f"Failed to get weather data: {e}")
@@ -194,10 +240,10 @@ class ChainlinkProvider:
     ) -> OracleDataPoint:
         """Convert Chainlink feed to generic oracle data point"""
         
-        return OracleDataPoint(
+        return OracleDataPoint.model_construct(
             provider=OracleProvider.CHAINLINK,
             data_type=DataCategory.PRICE,
-            value=float(feed.latest_answer),
+            value=feed.latest_answer_raw / 10 ** feed.decimals,
             timestamp=feed.updated_at,
             confidence=0.99,  # Chainlink has high confidence
             metadata={
@@ -3,10 +3,13 @@ Pyth Network Oracle Provider Implementation
 """
 
 import logging
-from typing import Dict, Any, List, Optional
-from datetime import datetime
-from decimal import Decimal
-import httpx
+import sys
+import time
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Tuple
+import aiohttp
+import orjson
 
 from ..schemas.oracle_schemas import (
     PythPriceFeed,
@@ -18,11 +21,56 @@ from ..schemas.oracle_schemas import (
 
 logger = logging.getLogger(__name__)
 
+
+def _to_int(v: Any) -> int:
+    """Convert a Hermes integer field (sent as a string) to int"""
+    return v if isinstance(v, int) else int(v)
+
+
+@lru_cache(maxsize=64)
+def _pow10(expo: int) -> float:
+    """Cached float scale factor for a Pyth exponent (typically -12..0)"""
+    return 10.0 ** expo
+
+
+def _scaled_mock_feed(price: float, expo: int) -> Tuple[int, int, int]:
+    """Scale a human-readable mock price into Pyth (price, confidence, expo) form"""
+    scale = 10 ** abs(expo)
+    return round(price * scale), round(price * 0.001 * scale), expo
+
+
+# Mock feeds used when Hermes is unreachable, scaled once at import
+_MOCK_PYTH_FEEDS: Dict[str, Tuple[int, int, int]] = {
+    symbol: _scaled_mock_feed(price, expo)
+    for symbol, (price, expo) in {
+        'BTC/USD': (65000.00, -8),
+        'ETH/USD': (3500.00, -8),
+        'SOL/USD': (110.00, -8),
+        'AVAX/USD': (35.00, -8),
+        'MATIC/USD': (0.85, -8),
+        'LINK/USD': (15.50, -8),
+        'EUR/USD': (1.08, -9),
+        'GOLD/USD': (2050.00, -8),
+        'TSLA': (250.00, -8),
+        'AAPL': (190.00, -8),
+        'SPX500': (5000.00, -8)
+    }.items()
+}
+_DEFAULT_MOCK_FEED = _scaled_mock_feed(100.00, -8)
+
+
 class PythProvider:
-    """Pyth Network oracle data provider"""
+    """
+    Pyth Network oracle data provider
+    
+    The Hermes HTTP session opens lazily on the first request and stays open
+    until released, so use ``async with PythProvider() as pyth:`` or await
+    ``close()`` when done. Providers owned by an OpenOracleRouter are closed
+    by the router.
+    """
     
-    # Pyth price feed IDs (mainnet)
-    PRICE_FEED_IDS = {
+    # Pyth price feed IDs (mainnet, read-only, interned keys)
+    PRICE_FEED_IDS = MappingProxyType({sys.intern(symbol): feed_id for symbol, feed_id in {
         'BTC/USD': '0xe62df6c8b4a85fe1a67db44dc12de5db330f7ac66b72dc658afedf0f4a415b43',
         'ETH/USD': '0xff61491a931112ddf1bd8147cd1b641375f79f5825126d665480874634fd0ace',
         'SOL/USD': '0xef0d8b6fda2ceba41da15d4095d1da392a0d2f8ed0c6c7bc0f4cfac8c280b56d',
@@ -41,15 +89,59 @@ class PythProvider:
         'GOOGL': '0xe6ceea896448e40011a70e713c4b10c094e1c02cc28f96b092b09e9bddbe33e1',
         'MSFT': '0xd0ff29120028486395e5fc7b4acf05d9e62fb0bc2ac965f9b24ac41cffd1444',
         'SPX500': '0x9e30a8e2e37e908c8e0b07a8b28c6e3a8a5c5e7d2f1e0d9c8b7a6c5e4d3c2b1a'
-    }
+    }.items()})
+    
+    # Hot-path lookup bound once, reading the public table so the two never diverge
+    _feed_id_lookup = PRICE_FEED_IDS.get
+    
+    # Reverse lookup for Hermes responses, which are keyed by feed ID
+    FEED_ID_TO_SYMBOL = MappingProxyType({v: k for k, v in PRICE_FEED_IDS.items()})
     
     # Pyth API endpoints
     HERMES_URL = "https://hermes.pyth.network"
     BENCHMARKS_URL = "https://benchmarks.pyth.network"
     
-    def __init__(self):
+    def __init__(self, cache_ttl_s: float = 1.0):
         self.hermes_url = self.HERMES_URL
         
+        # symbol -> (monotonic fetch time, feed); Hermes prices only move every ~400ms
+        self._cache: Dict[str, Tuple[float, PythPriceFeed]] = {}
+        self._cache_ttl = cache_ttl_s
+        
+        # Shared Hermes session, opened lazily inside the running event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    async def __aenter__(self):
+        """Async context manager entry"""
+        await self.start()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.close()
+    
+    async def start(self):
+        """Open the pooled Hermes HTTP session"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                base_url=self.hermes_url,
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300)
+            )
+    
+    async def close(self):
+        """Close the Hermes HTTP session"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+            self._session = None
+    
+    async def _hermes_get(self, path: str, params: List[Tuple[str, str]]) -> Optional[Any]:
+        """GET a Hermes endpoint and decode the JSON body, or None on non-200"""
+        await self.start()
+        async with self._session.get(path, params=params) as response:
+            if response.status != 200:
+                return None
+            return orjson.loads(await response.read())
+        
     async def get_price_feed(
         self,
         symbol: str,
@@ -57,46 +149,33 @@ class PythProvider:
     ) -> Optional[PythPriceFeed]:
         """Get price feed data from Pyth Network"""
         
+        entry = self._cache.get(symbol)
+        if entry and time.monotonic() - entry[0] < self._cache_ttl:
+            return entry[1]
+        
         try:
-            feed_id = self.PRICE_FEED_IDS.get(symbol)
+            feed_id = self._feed_id_lookup(symbol)
             if not feed_id:
                 logger.error(f"Price feed ID not found for symbol: {symbol}")
                 return None
             
             # Call Pyth Hermes API
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.hermes_url}/api/latest_price_feeds",
-                    params={"ids[]": feed_id}
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if data and len(data) > 0:
-                        feed_data = data[0]
-                        price_data = feed_data.get('price', {})
-                        
-                        return PythPriceFeed(
-                            feed_id=feed_id,
-                            symbol=symbol,
-                            price=Decimal(str(price_data.get('price', 0))),
-                            confidence=Decimal(str(price_data.get('conf', 0))),
-                            expo=price_data.get('expo', -8),
-                            publish_time=datetime.fromtimestamp(
-                                price_data.get('publish_time', 0)
-                            ),
-                            ema_price=Decimal(str(feed_data.get('ema_price', {}).get('price', 0))),
-                            ema_confidence=Decimal(str(feed_data.get('ema_price', {}).get('conf', 0))),
-                            num_publishers=feed_data.get('num_publishers', 0),
-                            max_num_publishers=feed_data.get('max_num_publishers', 0)
-                        )
-                else:
-                    # Fallback to mock data
-                    return self._get_mock_feed(symbol, feed_id)
+            data = await self._hermes_get(
+                "/api/latest_price_feeds",
+                params=[("ids[]", feed_id)]
+            )
+            
+            if data is None:
+                # Fallback to mock data
+                return self._get_mock_feed(symbol, feed_id)
+            if len(data) > 0:
+                feed = self._parse_feed(symbol, feed_id, data[0])
+                self._cache[symbol] = (time.monotonic(), feed)
+                return feed
                     
         except Exception as e:
             logger.error(f"Failed to get Pyth price feed: {e}")
-            return self._get_mock_feed(symbol, self.PRICE_FEED_IDS.get(symbol, ""))
+            return self._get_mock_feed(symbol, self._feed_id_lookup(symbol, ""))
     
     async def get_update_data(
         self,
@@ -104,20 +183,20 @@ class PythProvider:
     ) -> Optional[PythUpdateData]:
         """Get update data for on-chain price updates"""
         
+        now_ms = time.time_ns() // 1_000_000
+        
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.hermes_url}/api/get_vaa",
-                    params={"ids[]": feed_ids}
+            data = await self._hermes_get(
+                "/api/get_vaa",
+                params=[("ids[]", feed_id) for feed_id in feed_ids]
+            )
+            
+            if data is not None:
+                return PythUpdateData(
+                    update_data=data.get('vaa', []),
+                    update_fee=data.get('update_fee', 1),
+                    valid_time_ms=now_ms
                 )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    return PythUpdateData(
-                        update_data=data.get('vaa', []),
-                        update_fee=data.get('update_fee', 1),
-                        valid_time=datetime.utcnow()
-                    )
                     
         except Exception as e:
             logger.error(f"Failed to get Pyth update data: {e}")
@@ -126,50 +205,107 @@ class PythProvider:
         return PythUpdateData(
             update_data=["0x" + "00" * 100],  # Mock hex data
             update_fee=1,
-            valid_time=datetime.utcnow()
+            valid_time_ms=now_ms
         )
     
+    async def get_price_feeds_batch(
+        self,
+        symbols: List[str]
+    ) -> Dict[str, PythPriceFeed]:
+        """Get price feeds for several symbols with a single Hermes request"""
+        
+        feeds: Dict[str, PythPriceFeed] = {}
+        now = time.monotonic()
+        misses = []
+        for symbol in symbols:
+            entry = self._cache.get(symbol)
+            if entry and now - entry[0] < self._cache_ttl:
+                feeds[symbol] = entry[1]
+            elif symbol in self.PRICE_FEED_IDS:
+                misses.append(symbol)
+            else:
+                logger.error(f"Price feed ID not found for symbol: {symbol}")
+        
+        if not misses:
+            return feeds
+        
+        try:
+            data = await self._hermes_get(
+                "/api/latest_price_feeds",
+                params=[("ids[]", self.PRICE_FEED_IDS[s]) for s in misses]
+            )
+            
+            fetched_at = time.monotonic()
+            for feed_data in data or []:
+                # Hermes may return ids without the 0x prefix
+                feed_id = "0x" + feed_data.get('id', '').removeprefix("0x")
+                symbol = self.FEED_ID_TO_SYMBOL.get(feed_id)
+                if symbol is None:
+                    continue
+                feed = self._parse_feed(symbol, feed_id, feed_data)
+                self._cache[symbol] = (fetched_at, feed)
+                feeds[symbol] = feed
+                    
+        except Exception as e:
+            logger.error(f"Failed to get Pyth price feeds: {e}")
+        
+        # Fallback to mock data for anything Hermes did not return
+        for symbol in misses:
+            if symbol not in feeds:
+                feeds[symbol] = self._get_mock_feed(symbol, self.PRICE_FEED_IDS[symbol])
+        
+        return feeds
+    
     async def get_multiple_feeds(
         self,
         symbols: List[str]
     ) -> List[PythPriceFeed]:
         """Get multiple price feeds at once"""
         
-        feeds = []
-        for symbol in symbols:
-            feed = await self.get_price_feed(symbol)
-            if feed:
-                feeds.append(feed)
-        return feeds
+        feeds = await self.get_price_feeds_batch(symbols)
+        return [feeds[symbol] for symbol in symbols if symbol in feeds]
+    
+    def _parse_feed(
+        self,
+        symbol: str,
+        feed_id: str,
+        feed_data: Dict[str, Any]
+    ) -> PythPriceFeed:
+        """Build a price feed from a Hermes latest_price_feeds entry"""
+        
+        # Every field is explicitly converted below, so the model is built
+        # with model_construct rather than re-validated
+        
+        price_data = feed_data.get('price', {})
+        ema_data = feed_data.get('ema_price', {})
+        
+        return PythPriceFeed.model_construct(
+            feed_id=feed_id,
+            symbol=symbol,
+            price=_to_int(price_data.get('price', '0')),
+            confidence=_to_int(price_data.get('conf', '0')),
+            expo=price_data.get('expo', -8),
+            publish_time_ms=price_data.get('publish_time', 0) * 1000,
+            ema_price=_to_int(ema_data.get('price', '0')),
+            ema_confidence=_to_int(ema_data.get('conf', '0')),
+            num_publishers=feed_data.get('num_publishers', 0),
+            max_num_publishers=feed_data.get('max_num_publishers', 0)
+        )
     
     def _get_mock_feed(self, symbol: str, feed_id: str) -> PythPriceFeed:
         """Get mock price feed for testing"""
         
-        mock_prices = {
-            'BTC/USD': (65000.00, -8),
-            'ETH/USD': (3500.00, -8),
-            'SOL/USD': (110.00, -8),
-            'AVAX/USD': (35.00, -8),
-            'MATIC/USD': (0.85, -8),
-            'LINK/USD': (15.50, -8),
-            'EUR/USD': (1.08, -9),
-            'GOLD/USD': (2050.00, -8),
-            'TSLA': (250.00, -8),
-            'AAPL': (190.00, -8),
-            'SPX500': (5000.00, -8)
-        }
-        
-        price, expo = mock_prices.get(symbol, (100.00, -8))
-        
-        return PythPriceFeed(
+        price, confidence, expo = _MOCK_PYTH_FEEDS.get(symbol, _DEFAULT_MOCK_FEED)
+        
+        return PythPriceFeed.model_construct(
             feed_id=feed_id or "0x" + "0" * 64,
             symbol=symbol,
-            price=Decimal(str(price * (10 ** abs(expo)))),
-            confidence=Decimal(str(price * 0.001 * (10 ** abs(expo)))),
+            price=price,
+            confidence=confidence,
             expo=expo,
-            publish_time=datetime.utcnow(),
-            ema_price=Decimal(str(price * (10 ** abs(expo)))),
-            ema_confidence=Decimal(str(price * 0.001 * (10 ** abs(expo)))),
+            publish_time_ms=time.time_ns() // 1_000_000,
+            ema_price=price,
+            ema_confidence=confidence,
             num_publishers=20,
             max_num_publishers=25
         )
@@ -181,10 +317,11 @@ class PythProvider:
         """Convert Pyth feed to generic oracle data point"""
         
         # Adjust price for exponent
-        adjusted_price = float(feed.price) * (10 ** feed.expo)
-        adjusted_confidence = float(feed.confidence) * (10 ** feed.expo)
+        scale = _pow10(feed.expo)
+        adjusted_price = feed.price * scale
+        adjusted_confidence = feed.confidence * scale
         
-        return OracleDataPoint(
+        return OracleDataPoint.model_construct(
             provider=OracleProvider.PYTH,
             data_type=DataCategory.PRICE,
             value=adjusted_price,
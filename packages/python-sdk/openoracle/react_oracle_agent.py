@@ -3,20 +3,31 @@ ReAct Oracle Agent with Chain-of-Thought Reasoning
 Implements a thinking model for oracle selection decisions
 """
 
+import asyncio
 import json
 import logging
-from typing import Dict, Any, List, Optional, Tuple
+import re
+import sys
+from typing import Dict, Any, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
 from decimal import Decimal
 from enum import Enum
+from itertools import islice
 from pydantic import BaseModel, Field
+from cachetools import TTLCache
+from tenacity import (
+    retry, retry_if_exception_type, stop_after_attempt, wait_exponential, wait_random
+)
 import httpx
+import orjson
 
+from .core.exceptions import AIServiceError
 from .schemas.oracle_schemas import (
     OracleProvider,
     DataCategory,
     OracleRoutingRequest,
-    OracleRoutingResponse
+    OracleRoutingResponse,
+    UpdateFrequency
 )
 
 logger = logging.getLogger(__name__)
@@ -49,6 +60,175 @@ class OracleDecisionContext(BaseModel):
     cost_sensitivity: str
     chain_preferences: List[str]
 
+class CombinedAnalysis(BaseModel):
+    """Question context and reasoning chain produced by a single LLM call"""
+    context: OracleDecisionContext
+    reasoning: ReasoningChain
+
+class BatchedAnalysis(BaseModel):
+    """Combined analyses for a batch of questions, in question order"""
+    results: List[CombinedAnalysis]
+
+# OpenRouter statuses worth retrying: rate limiting and transient upstream failures
+_RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# ============ Static Prompt Fragments ============
+
+# Model schemas embedded in prompts, serialized once at import
+_CONTEXT_SCHEMA_JSON = json.dumps(OracleDecisionContext.model_json_schema(), indent=2)
+_REASONING_SCHEMA_JSON = json.dumps(ReasoningChain.model_json_schema(), indent=2)
+_COMBINED_SCHEMA_JSON = json.dumps(CombinedAnalysis.model_json_schema(), indent=2)
+_BATCHED_SCHEMA_JSON = json.dumps(BatchedAnalysis.model_json_schema(), indent=2)
+
+_COMBINED_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are an expert in blockchain oracles. Break down questions systematically, then think step-by-step through the oracle decision. Show your reasoning process clearly."
+}
+_CONTEXT_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are an expert analyst. Break down questions systematically and identify all requirements."
+}
+_REASONING_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are an expert in blockchain oracles. Think step-by-step through complex decisions. Show your reasoning process clearly."
+}
+
+# Category keywords for _infer_data_type, highest priority first
+_CATEGORY_KEYWORDS: Tuple[Tuple[Tuple[str, ...], DataCategory], ...] = (
+    (("price", "crypto"), DataCategory.PRICE),
+    (("sport", "game"), DataCategory.SPORTS),
+    (("election", "political"), DataCategory.ELECTION),
+    (("event", "announce"), DataCategory.EVENTS),
+)
+_KEYWORD_RANK = {
+    keyword: rank
+    for rank, (keywords, _) in enumerate(_CATEGORY_KEYWORDS)
+    for keyword in keywords
+}
+_CATEGORY_PATTERN = re.compile("|".join(_KEYWORD_RANK), re.IGNORECASE)
+_MAX_SCANNED_THOUGHTS = 32
+_MAX_SCANNED_CHARS = 2048
+
+# ============ Per-Oracle Decision Tables ============
+
+# Interned display labels, so formatting skips the Enum.value descriptor
+_ORACLE_LABELS: Dict[OracleProvider, str] = {p: sys.intern(p.value) for p in OracleProvider}
+
+# Nested values are tuples so the per-route shallow dict() copy shares nothing mutable
+_ORACLE_CONFIGS: Dict[OracleProvider, Dict[str, Any]] = {
+    OracleProvider.CHAINLINK: {
+        "feed_type": "aggregated",
+        "aggregation_method": "median",
+        "node_count": 7
+    },
+    OracleProvider.PYTH: {
+        "update_type": "pull",
+        "confidence_interval": "95%",
+        "max_staleness": 60
+    },
+    OracleProvider.UMA: {
+        "identifier": "YES_OR_NO_QUERY",
+        "bond_amount": "100",
+        "liveness_period": 7200,
+        "resolution_sources": ("Official sources", "News outlets")
+    },
+    OracleProvider.BAND: {
+        "request_type": "custom",
+        "aggregation_count": 3,
+        "min_consensus": 2
+    },
+    OracleProvider.API3: {
+        "api_type": "first_party",
+        "update_interval": 300,
+        "signed_data": True
+    }
+}
+
+# (cost, latency ms)
+_ORACLE_METRICS: Dict[OracleProvider, Tuple[Decimal, int]] = {
+    OracleProvider.CHAINLINK: (Decimal("0.50"), 500),
+    OracleProvider.PYTH: (Decimal("0.10"), 100),
+    OracleProvider.UMA: (Decimal("100.00"), 7200000),
+    OracleProvider.BAND: (Decimal("0.30"), 1000),
+    OracleProvider.API3: (Decimal("0.25"), 800)
+}
+_DEFAULT_METRICS = (Decimal("1.00"), 1000)
+
+_RESOLUTION_METHODS: Dict[OracleProvider, str] = {
+    OracleProvider.UMA: "optimistic",
+    OracleProvider.CHAINLINK: "aggregated",
+    OracleProvider.PYTH: "direct",
+    OracleProvider.BAND: "consensus",
+    OracleProvider.API3: "signed"
+}
+
+_UPDATE_FREQUENCIES: Dict[OracleProvider, UpdateFrequency] = {
+    OracleProvider.PYTH: UpdateFrequency.REALTIME,
+    OracleProvider.CHAINLINK: UpdateFrequency.HIGH_FREQ,
+    OracleProvider.UMA: UpdateFrequency.ON_DEMAND,
+    OracleProvider.BAND: UpdateFrequency.MEDIUM_FREQ,
+    OracleProvider.API3: UpdateFrequency.MEDIUM_FREQ
+}
+
+# ============ LLM Output Construction ============
+
+# The LLM is constrained to emit these shapes via response_format and the
+# embedded JSON schema, so replies are assembled with model_construct. Enum
+# fields are still coerced and the confidence bound still checked; anything
+# off-shape falls back to full validation.
+
+def _build_context(data: Dict[str, Any]) -> OracleDecisionContext:
+    """Build OracleDecisionContext from LLM JSON, validating only on mismatch"""
+    try:
+        return OracleDecisionContext.model_construct(
+            question_type=str(data["question_type"]),
+            data_requirements=dict(data["data_requirements"]),
+            timing_constraints=data.get("timing_constraints"),
+            accuracy_requirements=str(data["accuracy_requirements"]),
+            cost_sensitivity=str(data["cost_sensitivity"]),
+            chain_preferences=list(data["chain_preferences"])
+        )
+    except (KeyError, TypeError, ValueError):
+        return OracleDecisionContext.model_validate(data)
+
+def _build_reasoning(data: Dict[str, Any]) -> ReasoningChain:
+    """Build ReasoningChain from LLM JSON, validating only on mismatch"""
+    try:
+        confidence = float(data["confidence"])
+        if not 0 <= confidence <= 1:
+            raise ValueError("confidence out of range")
+        return ReasoningChain.model_construct(
+            question=str(data["question"]),
+            thoughts=[
+                ThoughtStep.model_construct(
+                    step_number=int(t["step_number"]),
+                    thought=str(t["thought"]),
+                    observation=str(t["observation"]),
+                    action=str(t["action"]),
+                    result=t.get("result")
+                )
+                for t in data["thoughts"]
+            ],
+            final_decision=str(data["final_decision"]),
+            selected_oracle=OracleProvider(data["selected_oracle"]),
+            confidence=confidence,
+            alternative_considered=[
+                OracleProvider(p) for p in data.get("alternative_considered") or []
+            ]
+        )
+    except (KeyError, TypeError, ValueError):
+        return ReasoningChain.model_validate(data)
+
+def _build_combined(data: Dict[str, Any]) -> CombinedAnalysis:
+    """Build CombinedAnalysis from LLM JSON, validating only on mismatch"""
+    try:
+        return CombinedAnalysis.model_construct(
+            context=_build_context(data["context"]),
+            reasoning=_build_reasoning(data["reasoning"])
+        )
+    except (KeyError, TypeError):
+        return CombinedAnalysis.model_validate(data)
+
 # ============ ReAct Oracle Agent ============
 
 class ReactOracleAgent:
@@ -57,10 +237,56 @@ class ReactOracleAgent:
     Uses chain-of-thought reasoning for complex decisions
     """
     
-    def __init__(self, openrouter_api_key: str):
+    # Questions arriving while a request is in flight share one OpenRouter
+    # request, sent when the batch fills or this window elapses
+    BATCH_WINDOW_MS = 20
+    MAX_BATCH_SIZE = 8
+    
+    # Question-independent analysis instructions shared by single and batched prompts
+    ANALYSIS_GUIDE = """
+        First, analyze the question's data requirements:
+        1. What type of question is this? (price, sports, political, event, etc.)
+        2. What specific data is needed to resolve it?
+        3. How quickly does it need to be resolved?
+        4. How accurate does the data need to be?
+        5. Is cost a major factor?
+        6. What blockchain networks might be involved?
+        
+        Then, using that analysis, reason step by step to pick an oracle.
+        
+        Available Oracles with their strengths:
+        1. CHAINLINK - Most reliable, wide coverage, sports partnerships, higher cost
+        2. PYTH - Ultra-fast updates, great for crypto/stocks, lower cost
+        3. UMA - Human verification, perfect for events/elections, slow but accurate
+        4. BAND - Custom data, flexible, medium speed and cost
+        5. API3 - Direct API access, first-party data, good for specific sources
+        
+        Step 1: Analyze what type of data is needed
+        Step 2: Consider timing requirements
+        Step 3: Evaluate accuracy vs speed trade-offs
+        Step 4: Consider cost implications
+        Step 5: Check chain compatibility
+        Step 6: Make final recommendation with reasoning
+        
+        For each step, provide:
+        - Thought: What you're considering
+        - Observation: What you notice about the requirements
+        - Action: What you'll check or evaluate
+        - Result: What you concluded
+        """
+    
+    def __init__(
+        self,
+        openrouter_api_key: str,
+        cache_size: int = 1024,
+        cache_ttl_s: float = 3600.0,
+        analysis_model: Optional[str] = None
+    ):
         self.api_key = openrouter_api_key
         self.base_url = "https://openrouter.ai/api/v1"
         self.model = "openai/gpt-4o-mini"
+        # Context analysis is plain classification; a smaller model can serve it
+        self.analysis_model = analysis_model or self.model
         
         # Define thinking prompts for different scenarios
         self.thinking_templates = {
@@ -70,6 +296,79 @@ class ReactOracleAgent:
             "decide": "Based on my analysis, the best choice is...",
             "verify": "Let me verify this decision makes sense..."
         }
+        
+        # Shared OpenRouter client so LLM calls reuse keep-alive connections
+        self._client: Optional[httpx.AsyncClient] = None
+        
+        # Pending questions for the next batched analysis request
+        self._batch_queue: List[Tuple[OracleRoutingRequest, asyncio.Future]] = []
+        self._batch_timer: Optional[asyncio.TimerHandle] = None
+        self._batch_tasks: Set[asyncio.Task] = set()
+        
+        # Oracle -> first validated routing response, reused as a copy template
+        self._response_templates: Dict[OracleProvider, OracleRoutingResponse] = {}
+        
+        # Normalized question -> (routing response, reasoning chain)
+        self._route_cache: TTLCache = TTLCache(maxsize=cache_size, ttl=cache_ttl_s)
+    
+    async def __aenter__(self):
+        """Async context manager entry"""
+        await self.start()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.close()
+    
+    async def start(self):
+        """Open the pooled OpenRouter HTTP client"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json"
+                },
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                timeout=30.0
+            )
+    
+    async def close(self):
+        """Close the OpenRouter HTTP client"""
+        if self._client and not self._client.is_closed:
+            await self._client.aclose()
+            self._client = None
+    
+    async def _chat_completion(self, payload: Dict[str, Any]) -> Optional[Any]:
+        """POST a chat completion and decode its JSON message content, or None on non-200"""
+        await self.start()
+        # Pre-encode once with orjson; the client already sends Content-Type: application/json
+        return await self._post_completion(orjson.dumps(payload))
+    
+    @retry(
+        stop=stop_after_attempt(3),
+        # Exponential backoff capped at 2s plus up to 100ms of jitter
+        wait=wait_exponential(multiplier=0.1, max=2.0) + wait_random(0, 0.1),
+        retry=retry_if_exception_type((httpx.TimeoutException, httpx.HTTPStatusError)),
+        reraise=True
+    )
+    async def _post_completion(self, body: bytes) -> Optional[Any]:
+        """Run one completion attempt, raising on transient HTTP errors"""
+        response = await self._client.post("/chat/completions", content=body)
+        if response.status_code in _RETRYABLE_STATUS_CODES:
+            response.raise_for_status()
+        if response.status_code != 200:
+            return None
+        result = orjson.loads(response.content)
+        # OpenRouter reports some upstream failures as a 200 with an error object
+        error = result.get("error")
+        if error:
+            raise AIServiceError(
+                "OpenRouter completion failed",
+                model=result.get("model"),
+                service_error=str(error.get("message", error) if isinstance(error, dict) else error)
+            )
+        return orjson.loads(result["choices"][0]["message"]["content"])
     
     async def think_and_route(
         self,
@@ -80,17 +379,178 @@ class ReactOracleAgent:
         Returns both the routing response and the reasoning chain
         """
         
-        # Step 1: Analyze the question
-        context = await self._analyze_question_context(request.question)
+        key = self._cache_key(request.question)
+        cached = self._route_cache.get(key)
+        if cached is not None:
+            return self._copy_route(*cached)
         
-        # Step 2: Generate reasoning chain
-        reasoning_chain = await self._generate_reasoning_chain(request, context)
+        # Steps 1-2: Analyze and reason in one LLM call, shared with concurrent callers
+        combined = await self._enqueue_analysis(request)
+        if combined is not None:
+            reasoning_chain = combined.reasoning
+        else:
+            # Fall back to the two-call flow
+            context = await self._analyze_question_context(request.question)
+            reasoning_chain = await self._generate_reasoning_chain(request, context)
         
         # Step 3: Make final decision based on reasoning
         routing_response = await self._make_oracle_decision(request, reasoning_chain)
         
+        # Only cache real LLM decisions, not fallback defaults
+        if combined is not None:
+            self._route_cache[key] = self._copy_route(routing_response, reasoning_chain)
+        
         return routing_response, reasoning_chain
     
+    @staticmethod
+    def _copy_route(
+        response: OracleRoutingResponse,
+        chain: ReasoningChain
+    ) -> Tuple[OracleRoutingResponse, ReasoningChain]:
+        """Deep-copy a cached route so callers never share its nested state"""
+        return response.model_copy(deep=True), chain.model_copy(deep=True)
+    
+    @staticmethod
+    def _cache_key(question: str) -> str:
+        """Normalize case, whitespace and trailing punctuation of a question"""
+        return " ".join(question.lower().split()).rstrip("?!. ")
+    
+    async def _analyze_and_reason(
+        self,
+        request: OracleRoutingRequest
+    ) -> Optional[CombinedAnalysis]:
+        """Analyze requirements and generate the reasoning chain in one request"""
+        
+        prompt = f"""
+        I need to select the best oracle for this prediction market question.
+        
+        Question: "{request.question}"
+        {self.ANALYSIS_GUIDE}
+        Respond with a JSON object with "context" (the requirements analysis)
+        followed by "reasoning" (the step-by-step decision), matching this schema:
+        {_COMBINED_SCHEMA_JSON}
+        """
+        
+        try:
+            data = await self._request_analysis(prompt, max_tokens=2000)
+            if data is not None:
+                return _build_combined(data)
+        except Exception as e:
+            logger.error(f"Combined analysis failed: {e}")
+        
+        return None
+    
+    async def _analyze_and_reason_batch(
+        self,
+        requests: List[OracleRoutingRequest]
+    ) -> List[Optional[CombinedAnalysis]]:
+        """Analyze several questions in one request, one result per question"""
+        
+        questions = "\n        ".join(
+            f'{i}. "{request.question}"' for i, request in enumerate(requests)
+        )
+        prompt = f"""
+        I need to select the best oracle for each of these prediction market questions.
+        
+        Questions:
+        {questions}
+        
+        Handle every question independently.
+        {self.ANALYSIS_GUIDE}
+        Respond with a JSON object whose "results" array holds one entry per
+        question, where element i answers question i, matching this schema:
+        {_BATCHED_SCHEMA_JSON}
+        """
+        
+        try:
+            data = await self._request_analysis(prompt, max_tokens=2000 * len(requests))
+            if data is not None:
+                results = [self._build_batch_item(item) for item in data["results"]]
+                if len(results) == len(requests):
+                    return results
+                logger.error(
+                    f"Batched analysis returned {len(results)} results for {len(requests)} questions"
+                )
+        except Exception as e:
+            logger.error(f"Batched analysis failed: {e}")
+        
+        return [None] * len(requests)
+    
+    @staticmethod
+    def _build_batch_item(item: Any) -> Optional[CombinedAnalysis]:
+        """Validate one batched result; a malformed entry only fails its own question"""
+        try:
+            return _build_combined(item)
+        except Exception as e:
+            logger.error(f"Malformed batched analysis entry: {e}")
+            return None
+    
+    async def _request_analysis(self, prompt: str, max_tokens: int) -> Optional[Dict[str, Any]]:
+        """Send a combined analysis prompt and decode the JSON reply"""
+        
+        return await self._chat_completion({
+            "model": self.model,
+            "messages": [
+                _COMBINED_SYSTEM_MESSAGE,
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.4,
+            "max_tokens": max_tokens,
+            "response_format": {"type": "json_object"}
+        })
+    
+    async def _enqueue_analysis(
+        self,
+        request: OracleRoutingRequest
+    ) -> Optional[CombinedAnalysis]:
+        """Queue a question for the next batched analysis request"""
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._batch_queue.append((request, future))
+        
+        # Nothing in flight means nothing to wait for; later arrivals batch behind this one
+        if not self._batch_tasks or len(self._batch_queue) >= self.MAX_BATCH_SIZE:
+            self._flush_batch()
+        elif self._batch_timer is None:
+            self._batch_timer = loop.call_later(self.BATCH_WINDOW_MS / 1000, self._flush_batch)
+        
+        return await future
+    
+    def _flush_batch(self):
+        """Send queued questions, at most MAX_BATCH_SIZE per request"""
+        
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+        
+        while self._batch_queue:
+            batch = self._batch_queue[:self.MAX_BATCH_SIZE]
+            del self._batch_queue[:self.MAX_BATCH_SIZE]
+            task = asyncio.ensure_future(self._run_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+    
+    async def _run_batch(
+        self,
+        batch: List[Tuple[OracleRoutingRequest, asyncio.Future]]
+    ):
+        """Run one batched analysis and hand each caller its slice"""
+        
+        requests = [request for request, _ in batch]
+        try:
+            if len(requests) == 1:
+                results = [await self._analyze_and_reason(requests[0])]
+            else:
+                results = await self._analyze_and_reason_batch(requests)
+        except Exception as e:
+            logger.error(f"Batched analysis failed: {e}")
+            results = [None] * len(batch)
+        
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+    
     async def _analyze_question_context(self, question: str) -> OracleDecisionContext:
         """Analyze question to understand requirements"""
         
@@ -108,37 +568,25 @@ class ReactOracleAgent:
         6. What blockchain networks might be involved?
         
         Respond with a JSON object matching this schema:
-        {json.dumps(OracleDecisionContext.model_json_schema(), indent=2)}
+        {_CONTEXT_SCHEMA_JSON}
         """
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": self.model,
-                        "messages": [
-                            {
-                                "role": "system",
-                                "content": "You are an expert analyst. Break down questions systematically and identify all requirements."
-                            },
-                            {"role": "user", "content": prompt}
-                        ],
-                        "temperature": 0.3,
-                        "max_tokens": 500,
-                        "response_format": {"type": "json_object"}
-                    }
-                )
+            data = await self._chat_completion({
+                "model": self.analysis_model,
+                "messages": [
+                    _CONTEXT_SYSTEM_MESSAGE,
+                    {"role": "user", "content": prompt}
+                ],
+                "temperature": 0.3,
+                # OracleDecisionContext JSON is well under this
+                "max_tokens": 200,
+                "response_format": {"type": "json_object"}
+            })
+            
+            if data is not None:
+                return _build_context(data)
                 
-                if response.status_code == 200:
-                    result = response.json()
-                    data = json.loads(result["choices"][0]["message"]["content"])
-                    return OracleDecisionContext.model_validate(data)
-                    
         except Exception as e:
             logger.error(f"Context analysis failed: {e}")
             
@@ -196,37 +644,24 @@ class ReactOracleAgent:
         - Result: What you concluded
         
         Respond with a JSON object matching this schema:
-        {json.dumps(ReasoningChain.model_json_schema(), indent=2)}
+        {_REASONING_SCHEMA_JSON}
         """
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": self.model,
-                        "messages": [
-                            {
-                                "role": "system",
-                                "content": "You are an expert in blockchain oracles. Think step-by-step through complex decisions. Show your reasoning process clearly."
-                            },
-                            {"role": "user", "content": prompt}
-                        ],
-                        "temperature": 0.4,
-                        "max_tokens": 1500,
-                        "response_format": {"type": "json_object"}
-                    }
-                )
+            data = await self._chat_completion({
+                "model": self.model,
+                "messages": [
+                    _REASONING_SYSTEM_MESSAGE,
+                    {"role": "user", "content": prompt}
+                ],
+                "temperature": 0.4,
+                "max_tokens": 1500,
+                "response_format": {"type": "json_object"}
+            })
+            
+            if data is not None:
+                return _build_reasoning(data)
                 
-                if response.status_code == 200:
-                    result = response.json()
-                    data = json.loads(result["choices"][0]["message"]["content"])
-                    return ReasoningChain.model_validate(data)
-                    
         except Exception as e:
             logger.error(f"Reasoning chain generation failed: {e}")
         
@@ -256,135 +691,83 @@ class ReactOracleAgent:
         
         # Extract key insights from reasoning
         oracle = reasoning.selected_oracle
-        confidence = reasoning.confidence
         
-        # Build oracle configuration based on selection
-        oracle_config = self._build_oracle_config(oracle, request.question)
+        # Fields that vary per request; everything else depends only on the oracle
+        per_request = {
+            "reasoning": self._format_reasoning(reasoning),
+            "oracle_config": self._build_oracle_config(oracle, request.question),
+            "alternatives": reasoning.alternative_considered[:2] if reasoning.alternative_considered else None,
+            "data_type": self._infer_data_type(reasoning),
+            "required_feeds": [],
+            "confidence_score": reasoning.confidence
+        }
+        
+        # Repeat routes to an oracle copy its validated first response
+        template = self._response_templates.get(oracle)
+        if template is not None:
+            return template.model_copy(update=per_request)
         
         # Estimate metrics
         cost, latency = self._estimate_metrics(oracle)
         
-        # Format the reasoning into a clear explanation
-        reasoning_text = self._format_reasoning(reasoning)
-        
-        return OracleRoutingResponse(
+        response = OracleRoutingResponse(
             can_resolve=True,
             selected_oracle=oracle,
-            reasoning=reasoning_text,
-            oracle_config=oracle_config,
-            alternatives=reasoning.alternative_considered[:2] if reasoning.alternative_considered else None,
-            data_type=self._infer_data_type(reasoning),
-            required_feeds=[],
             estimated_cost_usd=cost,
             estimated_latency_ms=latency,
-            confidence_score=confidence,
             resolution_method=self._get_resolution_method(oracle),
-            update_frequency=self._get_update_frequency(oracle)
+            update_frequency=self._get_update_frequency(oracle),
+            **per_request
         )
+        self._response_templates[oracle] = response
+        return response
     
     def _build_oracle_config(self, oracle: OracleProvider, question: str) -> Dict[str, Any]:
         """Build oracle-specific configuration"""
         
-        configs = {
-            OracleProvider.CHAINLINK: {
-                "feed_type": "aggregated",
-                "aggregation_method": "median",
-                "node_count": 7
-            },
-            OracleProvider.PYTH: {
-                "update_type": "pull",
-                "confidence_interval": "95%",
-                "max_staleness": 60
-            },
-            OracleProvider.UMA: {
-                "identifier": "YES_OR_NO_QUERY",
-                "bond_amount": "100",
-                "liveness_period": 7200,
-                "resolution_sources": ["Official sources", "News outlets"]
-            },
-            OracleProvider.BAND: {
-                "request_type": "custom",
-                "aggregation_count": 3,
-                "min_consensus": 2
-            },
-            OracleProvider.API3: {
-                "api_type": "first_party",
-                "update_interval": 300,
-                "signed_data": True
-            }
-        }
-        
-        return configs.get(oracle, {})
+        return dict(_ORACLE_CONFIGS.get(oracle, {}))
     
     def _estimate_metrics(self, oracle: OracleProvider) -> Tuple[Decimal, int]:
         """Estimate cost and latency for oracle"""
         
-        metrics = {
-            OracleProvider.CHAINLINK: (Decimal("0.50"), 500),
-            OracleProvider.PYTH: (Decimal("0.10"), 100),
-            OracleProvider.UMA: (Decimal("100.00"), 7200000),
-            OracleProvider.BAND: (Decimal("0.30"), 1000),
-            OracleProvider.API3: (Decimal("0.25"), 800)
-        }
-        
-        return metrics.get(oracle, (Decimal("1.00"), 1000))
+        return _ORACLE_METRICS.get(oracle, _DEFAULT_METRICS)
     
     def _format_reasoning(self, reasoning: ReasoningChain) -> str:
         """Format reasoning chain into readable explanation"""
         
-        key_thoughts = [t for t in reasoning.thoughts if t.result]
-        
-        if key_thoughts:
-            main_reason = key_thoughts[-1].result or reasoning.final_decision
-        else:
-            main_reason = reasoning.final_decision
+        main_reason = next(
+            (t.result for t in reversed(reasoning.thoughts) if t.result),
+            reasoning.final_decision
+        )
         
-        return f"{reasoning.selected_oracle.value} selected: {main_reason} (confidence: {reasoning.confidence:.0%})"
+        return f"{_ORACLE_LABELS[reasoning.selected_oracle]} selected: {main_reason} (confidence: {reasoning.confidence:.0%})"
     
     def _infer_data_type(self, reasoning: ReasoningChain) -> DataCategory:
         """Infer data category from reasoning"""
         
-        # Look for keywords in the reasoning
-        reasoning_text = " ".join([t.thought + t.observation for t in reasoning.thoughts]).lower()
-        
-        if "price" in reasoning_text or "crypto" in reasoning_text:
-            return DataCategory.PRICE
-        elif "sport" in reasoning_text or "game" in reasoning_text:
-            return DataCategory.SPORTS
-        elif "election" in reasoning_text or "political" in reasoning_text:
-            return DataCategory.ELECTION
-        elif "event" in reasoning_text or "announce" in reasoning_text:
-            return DataCategory.EVENTS
-        else:
-            return DataCategory.CUSTOM
+        # Single regex pass per text; keep the highest-priority category seen
+        best_rank = len(_CATEGORY_KEYWORDS)
+        # Bounded so a runaway LLM reply can't make this scan arbitrarily long
+        for t in islice(reasoning.thoughts, _MAX_SCANNED_THOUGHTS):
+            for text in (t.thought, t.observation):
+                for match in _CATEGORY_PATTERN.finditer(text, 0, _MAX_SCANNED_CHARS):
+                    rank = _KEYWORD_RANK[match.group().lower()]
+                    if rank < best_rank:
+                        if rank == 0:
+                            return _CATEGORY_KEYWORDS[0][1]
+                        best_rank = rank
+        
+        return _CATEGORY_KEYWORDS[best_rank][1] if best_rank < len(_CATEGORY_KEYWORDS) else DataCategory.CUSTOM
     
     def _get_resolution_method(self, oracle: OracleProvider) -> str:
         """Get resolution method for oracle"""
         
-        methods = {
-            OracleProvider.UMA: "optimistic",
-            OracleProvider.CHAINLINK: "aggregated",
-            OracleProvider.PYTH: "direct",
-            OracleProvider.BAND: "consensus",
-            OracleProvider.API3: "signed"
-        }
-        
-        return methods.get(oracle, "direct")
+        return _RESOLUTION_METHODS.get(oracle, "direct")
     
     def _get_update_frequency(self, oracle: OracleProvider) -> str:
         """Get update frequency for oracle"""
         
-        from .schemas.oracle_schemas import UpdateFrequency
-        
-        frequencies = {
-            OracleProvider.PYTH: UpdateFrequency.REALTIME,
-            OracleProvider.CHAINLINK: UpdateFrequency.HIGH_FREQ,
-            OracleProvider.UMA: UpdateFrequency.ON_DEMAND,
-            OracleProvider.BAND: UpdateFrequency.MEDIUM_FREQ,
-            OracleProvider.API3: UpdateFrequency.MEDIUM_FREQ
-        }
-        
-        return frequencies.get(oracle, UpdateFrequency.LOW_FREQ)
+        return _UPDATE_FREQUENCIES.get(oracle, UpdateFrequency.LOW_FREQ)
 
 # ============ Usage Example ============
 
@@ -400,6 +783,7 @@ async def demonstrate_thinking_oracle():
     
     # Get routing with reasoning
     response, reasoning = await agent.think_and_route(request)
+    await agent.close()
     
     # Display the thinking process
     print("🧠 Chain of Thought Reasoning:")
@@ -414,16 +798,16 @@ async def demonstrate_thinking_oracle():
             print(f"  ✅ Result: {thought.result}")
     
     print(f"\n🎯 Final Decision: {reasoning.final_decision}")
-    print(f"   Selected Oracle: {reasoning.selected_oracle.value}")
+    print(f"   Selected Oracle: {_ORACLE_LABELS[reasoning.selected_oracle]}")
     print(f"   Confidence: {reasoning.confidence:.0%}")
     
     if reasoning.alternative_considered:
-        print(f"   Alternatives Considered: {', '.join([o.value for o in reasoning.alternative_considered])}")
+        print(f"   Alternatives Considered: {', '.join(_ORACLE_LABELS[o] for o in reasoning.alternative_considered)}")
     
     print("\n" + "=" * 60)
     print(f"📊 Routing Response:")
     print(f"   Can Resolve: {response.can_resolve}")
-    print(f"   Oracle: {response.selected_oracle.value}")
+    print(f"   Oracle: {_ORACLE_LABELS[response.selected_oracle]}")
     print(f"   Reasoning: {response.reasoning}")
     print(f"   Estimated Cost: ${response.estimated_cost_usd}")
     print(f"   Estimated Latency: {response.estimated_latency_ms}ms")
\ No newline at end of file
@@ -8,11 +8,61 @@ with the smart contract structures defined in:
 All Pydantic models here MUST match the Solidity structs exactly.
 """
 
-from typing import List, Optional, Dict, Any, Literal, Union
+from array import array
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Annotated, List, Optional, Dict, Any, Literal, Union
 from datetime import datetime
 from enum import Enum
-from pydantic import BaseModel, Field, validator
+from pydantic import (
+    AfterValidator, BaseModel, BeforeValidator, ConfigDict, Field, StringConstraints,
+    TypeAdapter
+)
 import json
+import re
+import string
+
+import orjson
+
+# ============ Solidity Primitive Types ============
+
+# Patterns are enforced inside pydantic-core, without a Python validator call per field
+Address = Annotated[str, StringConstraints(pattern=r'^0x[0-9a-fA-F]{40}$')]
+
+def _bytes_to_hex(value: Any) -> Any:
+    """Render raw bytes input as the 0x-prefixed hex string the pattern checks"""
+    if isinstance(value, (bytes, bytearray)):
+        return "0x" + value.hex()
+    return value
+
+# bytes fields stay 0x-prefixed hex strings in Python and on the wire;
+# raw bytes are also accepted on input
+Bytes32 = Annotated[
+    str,
+    BeforeValidator(_bytes_to_hex),
+    StringConstraints(pattern=r'^0x[0-9a-fA-F]{64}$')
+]
+HexBytes = Annotated[
+    str,
+    BeforeValidator(_bytes_to_hex),
+    StringConstraints(pattern=r'^(0x[0-9a-fA-F]*)?$')
+]
+
+# Bounded pool sharing one str object per distinct oracle source name;
+# only low-cardinality fields belong here, since entries are never evicted
+_STRING_POOL_LIMIT = 4096
+_string_pool: Dict[str, str] = {}
+
+def _pooled(value: str) -> str:
+    """Return the pooled copy of value, adding it while the pool has room"""
+    pooled = _string_pool.get(value)
+    if pooled is not None:
+        return pooled
+    if len(_string_pool) < _STRING_POOL_LIMIT:
+        _string_pool[value] = value
+    return value
+
+PooledStr = Annotated[str, AfterValidator(_pooled)]
 
 # ============ Contract Enums (matching IOracle.sol) ============
 
@@ -31,6 +81,11 @@ class MarketStatus(str, Enum):
     CANCELLED = "CANCELLED" # 2
     DISPUTED = "DISPUTED"   # 3
 
+# Field annotations use these Literals so pydantic-core validates plain strings
+# without building Enum members; the Enums above remain for programmatic use
+OracleProviderName = Literal["CHAINLINK", "PYTH", "UMA", "API3", "CUSTOM"]
+MarketStatusName = Literal["ACTIVE", "RESOLVED", "CANCELLED", "DISPUTED"]
+
 # ============ Core Contract Structures ============
 
 class OracleData(BaseModel):
@@ -38,18 +93,13 @@ class OracleData(BaseModel):
     value: int = Field(..., description="uint256 value")
     timestamp: int = Field(..., description="uint256 timestamp") 
     confidence: int = Field(..., ge=0, le=10000, description="uint256 confidence (scaled by 1e4)")
-    data_id: str = Field(..., description="bytes32 dataId (hex string)")
-    source: str = Field(..., description="string source")
-    
-    @validator('data_id')
-    def validate_data_id(cls, v):
-        # Must be valid hex string for bytes32
-        if not v.startswith('0x') or len(v) != 66:
-            raise ValueError('data_id must be a valid bytes32 hex string')
-        return v
-    
-    class Config:
-        json_schema_extra = {
+    data_id: Bytes32 = Field(..., description="bytes32 dataId (hex string)")
+    source: PooledStr = Field(..., description="string source")
+    
+    model_config = ConfigDict(
+        frozen=True,
+        extra='forbid',
+        json_schema_extra={
             "example": {
                 "value": 4250000000000000000000,  # $4250.00 with 18 decimals
                 "timestamp": 1703097600,
@@ -58,6 +108,11 @@ class OracleData(BaseModel):
                 "source": "chainlink_aggregator"
             }
         }
+    )
+    
+    def to_uint256(self) -> int:
+        """dataId as the uint256 the contract sees; int() parses hex in C"""
+        return int(self.data_id, 16)
 
 class PriceData(BaseModel):
     """Matches IOracle.PriceData struct exactly"""
@@ -65,16 +120,12 @@ class PriceData(BaseModel):
     timestamp: int = Field(..., description="uint256 timestamp")
     decimals: int = Field(..., ge=0, le=18, description="uint8 decimals")
     confidence: int = Field(..., ge=0, le=10000, description="uint256 confidence")
-    feed_id: str = Field(..., description="bytes32 feedId")
+    feed_id: Bytes32 = Field(..., description="bytes32 feedId")
     
-    @validator('feed_id')
-    def validate_feed_id(cls, v):
-        if not v.startswith('0x') or len(v) != 66:
-            raise ValueError('feed_id must be a valid bytes32 hex string')
-        return v
-    
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        extra='forbid',
+        json_schema_extra={
             "example": {
                 "price": 4250000000,  # $4250.00 with 6 decimals (USDC format)
                 "timestamp": 1703097600,
@@ -83,24 +134,24 @@ class PriceData(BaseModel):
                 "feed_id": "0xff61491a931112ddf1bd8147cd1b641375f79f5825126d665480874634fd0ace"
             }
         }
+    )
+    
+    def to_uint256(self) -> int:
+        """feedId as the uint256 the contract sees; int() parses hex in C"""
+        return int(self.feed_id, 16)
 
 class ResolutionData(BaseModel):
     """Matches IOracle.ResolutionData struct exactly"""
     result: int = Field(..., description="uint256 result")
     resolved: bool = Field(..., description="bool resolved")
     timestamp: int = Field(..., description="uint256 timestamp")
-    proof: str = Field(..., description="bytes proof (hex string)")
+    proof: HexBytes = Field(..., description="bytes proof (hex string)")
     metadata: str = Field(..., description="string metadata")
     
-    @validator('proof')
-    def validate_proof(cls, v):
-        # Must be valid hex string for bytes
-        if v and not v.startswith('0x'):
-            raise ValueError('proof must be a valid hex string')
-        return v
-    
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        extra='forbid',
+        json_schema_extra={
             "example": {
                 "result": 1,  # Option 1 wins
                 "resolved": True,
@@ -109,25 +160,21 @@ class ResolutionData(BaseModel):
                 "metadata": "BTC price was $105,000 at resolution time"
             }
         }
+    )
 
 # ============ Router Structures ============
 
 class RouteConfig(BaseModel):
     """Matches IOracleRouter.RouteConfig struct exactly"""
-    provider: OracleProvider = Field(..., description="OracleProvider provider")
-    oracle_address: str = Field(..., description="address oracleAddress")
+    provider: OracleProviderName = Field(..., description="OracleProvider provider")
+    oracle_address: Address = Field(..., description="address oracleAddress")
     priority: int = Field(..., description="uint256 priority")
     max_cost: int = Field(..., description="uint256 maxCost")
     is_active: bool = Field(..., description="bool isActive")
     
-    @validator('oracle_address')
-    def validate_address(cls, v):
-        if not v.startswith('0x') or len(v) != 42:
-            raise ValueError('oracle_address must be a valid Ethereum address')
-        return v
-    
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "provider": "CHAINLINK",
                 "oracle_address": "0x5f4ec3df9cbd43714fe2740f5e3616155c5b8419",
@@ -136,23 +183,42 @@ class RouteConfig(BaseModel):
                 "is_active": True
             }
         }
+    )
+    
+    @classmethod
+    @lru_cache(maxsize=256)
+    def from_fields(
+        cls,
+        provider: str,
+        oracle_address: str,
+        priority: int,
+        max_cost: int,
+        is_active: bool
+    ) -> "RouteConfig":
+        """
+        Validated RouteConfig shared across calls with the same fields
+        
+        Route configs come from a handful of oracle contracts, so each
+        distinct tuple is validated once and the frozen instance reused.
+        """
+        return cls(
+            provider=provider,
+            oracle_address=oracle_address,
+            priority=priority,
+            max_cost=max_cost,
+            is_active=is_active
+        )
 
 class RouteResult(BaseModel):
     """Matches IOracleRouter.RouteResult struct exactly"""
     success: bool = Field(..., description="bool success")
-    selected_provider: OracleProvider = Field(..., description="OracleProvider selectedProvider")
-    oracle_address: str = Field(..., description="address oracleAddress")
+    selected_provider: OracleProviderName = Field(..., description="OracleProvider selectedProvider")
+    oracle_address: Address = Field(..., description="address oracleAddress")
     estimated_cost: int = Field(..., description="uint256 estimatedCost")
     reason: str = Field(..., description="string reason")
     
-    @validator('oracle_address')
-    def validate_address(cls, v):
-        if v != "0x0000000000000000000000000000000000000000" and (not v.startswith('0x') or len(v) != 42):
-            raise ValueError('oracle_address must be a valid Ethereum address or zero address')
-        return v
-    
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": True,
                 "selected_provider": "CHAINLINK",
@@ -161,6 +227,7 @@ class RouteResult(BaseModel):
                 "reason": "Best price-reliability ratio"
             }
         }
+    )
 
 # ============ Prediction Market Structures ============
 
@@ -168,35 +235,17 @@ class Market(BaseModel):
     """Matches IPredictionMarket.Market struct exactly"""
     market_id: int = Field(..., description="uint256 marketId")
     question: str = Field(..., description="string question")
-    creator: str = Field(..., description="address creator")
+    creator: Address = Field(..., description="address creator")
     end_time: int = Field(..., description="uint256 endTime")
-    status: MarketStatus = Field(..., description="MarketStatus status")
+    status: MarketStatusName = Field(..., description="MarketStatus status")
     total_pool: int = Field(..., description="uint256 totalPool")
-    payment_token: str = Field(..., description="address paymentToken")
-    oracle_data_type: str = Field(..., description="bytes32 oracleDataType")
-    assigned_oracle: str = Field(..., description="address assignedOracle")
-    oracle_params: str = Field(..., description="bytes oracleParams")
-    
-    @validator('creator', 'payment_token', 'assigned_oracle')
-    def validate_addresses(cls, v):
-        if not v.startswith('0x') or len(v) != 42:
-            raise ValueError('Address must be valid Ethereum address')
-        return v
-    
-    @validator('oracle_data_type')
-    def validate_data_type(cls, v):
-        if not v.startswith('0x') or len(v) != 66:
-            raise ValueError('oracle_data_type must be valid bytes32')
-        return v
-    
-    @validator('oracle_params')
-    def validate_params(cls, v):
-        if v and not v.startswith('0x'):
-            raise ValueError('oracle_params must be valid hex bytes')
-        return v
-    
-    class Config:
-        json_schema_extra = {
+    payment_token: Address = Field(..., description="address paymentToken")
+    oracle_data_type: Bytes32 = Field(..., description="bytes32 oracleDataType")
+    assigned_oracle: Address = Field(..., description="address assignedOracle")
+    oracle_params: HexBytes = Field(..., description="bytes oracleParams")
+    
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "market_id": 123,
                 "question": "Will BTC exceed $100k by Dec 31, 2024?",
@@ -210,6 +259,7 @@ class Market(BaseModel):
                 "oracle_params": "0x4254432d555344"  # "BTC-USD" encoded
             }
         }
+    )
 
 class Position(BaseModel):
     """Matches IPredictionMarket.Position struct exactly"""
@@ -218,8 +268,10 @@ class Position(BaseModel):
     timestamp: int = Field(..., description="uint256 timestamp")
     multiplier: int = Field(..., description="uint256 multiplier")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        extra='forbid',
+        json_schema_extra={
             "example": {
                 "amount": 5000000000000000000,  # 5 ETH
                 "outcome": 1,  # Option 1
@@ -227,21 +279,94 @@ class Position(BaseModel):
                 "multiplier": 15000  # 1.5x multiplier (scaled by 1e4)
             }
         }
+    )
+
+# ============ Batch Structures ============
+
+@dataclass
+class OracleDataBatch:
+    """
+    Column-oriented batch of OracleData rows for bulk on-chain event ingestion
+    
+    Timestamps and confidences live in typed arrays and data ids are packed
+    as raw 32-byte values, so scans and filters walk flat buffers instead of
+    per-row Pydantic instances. Values stay Python ints since uint256 does
+    not fit a machine word.
+    """
+    values: List[int] = field(default_factory=list)
+    timestamps: array = field(default_factory=lambda: array('q'))
+    confidences: array = field(default_factory=lambda: array('H'))
+    data_ids: bytearray = field(default_factory=bytearray)
+    sources: List[str] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.values)
+    
+    @classmethod
+    def from_rows(cls, rows: List[OracleData]) -> "OracleDataBatch":
+        """Pack validated OracleData rows into columns"""
+        return cls(
+            values=[row.value for row in rows],
+            timestamps=array('q', [row.timestamp for row in rows]),
+            confidences=array('H', [row.confidence for row in rows]),
+            data_ids=bytearray(b"".join(bytes.fromhex(row.data_id[2:]) for row in rows)),
+            sources=[row.source for row in rows]
+        )
+    
+    def to_rows(self) -> List[OracleData]:
+        """Unpack columns back into OracleData rows for RPC/JSON boundaries"""
+        ids = self.data_ids
+        return [
+            OracleData.model_construct(
+                value=self.values[i],
+                timestamp=self.timestamps[i],
+                confidence=self.confidences[i],
+                data_id="0x" + ids[i * 32:(i + 1) * 32].hex(),
+                source=self.sources[i]
+            )
+            for i in range(len(self.values))
+        ]
+    
+    def select(self, indices: List[int]) -> "OracleDataBatch":
+        """Build a new batch from the rows at the given indices"""
+        ids = self.data_ids
+        return OracleDataBatch(
+            values=[self.values[i] for i in indices],
+            timestamps=array('q', [self.timestamps[i] for i in indices]),
+            confidences=array('H', [self.confidences[i] for i in indices]),
+            data_ids=bytearray(b"".join(ids[i * 32:(i + 1) * 32] for i in indices)),
+            sources=[self.sources[i] for i in indices]
+        )
+    
+    def filter(
+        self,
+        min_timestamp: Optional[int] = None,
+        min_confidence: Optional[int] = None
+    ) -> "OracleDataBatch":
+        """Keep rows newer than min_timestamp and at least min_confidence"""
+        ts_floor = -1 if min_timestamp is None else min_timestamp
+        conf_floor = 0 if min_confidence is None else min_confidence
+        return self.select([
+            i for i, (ts, conf) in enumerate(zip(self.timestamps, self.confidences))
+            if ts > ts_floor and conf >= conf_floor
+        ])
 
 # ============ LLM Response Schemas ============
 
 class OracleRoutingResponse(BaseModel):
     """JSON schema for LLM responses when selecting oracle providers"""
-    selected_oracle: OracleProvider = Field(..., description="The selected oracle provider")
+    response_type: Literal["routing"] = Field("routing", description="Response type tag")
+    selected_oracle: OracleProviderName = Field(..., description="The selected oracle provider")
     reasoning: str = Field(..., min_length=50, description="Detailed reasoning for selection")
     confidence: float = Field(..., ge=0, le=1, description="Confidence in selection (0-1)")
     estimated_cost: Optional[float] = Field(None, description="Estimated cost in USD")
     estimated_time: Optional[int] = Field(None, description="Estimated response time in seconds")
-    fallback_options: List[OracleProvider] = Field(default_factory=list, description="Alternative providers")
+    fallback_options: List[OracleProviderName] = Field(default_factory=list, description="Alternative providers")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
+                "response_type": "routing",
                 "selected_oracle": "CHAINLINK",
                 "reasoning": "Chainlink is optimal for BTC price data due to its robust aggregation of multiple high-quality price feeds with proven reliability and sub-minute updates",
                 "confidence": 0.92,
@@ -250,9 +375,11 @@ class OracleRoutingResponse(BaseModel):
                 "fallback_options": ["PYTH", "API3"]
             }
         }
+    )
 
 class PredictionMarketResolution(BaseModel):
     """JSON schema for LLM responses when resolving prediction markets"""
+    response_type: Literal["resolution"] = Field("resolution", description="Response type tag")
     winning_outcome: int = Field(..., ge=0, le=255, description="Winning outcome index")
     resolution_value: Optional[int] = Field(None, description="Actual value that determined outcome")
     confidence: float = Field(..., ge=0, le=1, description="Confidence in resolution")
@@ -261,9 +388,10 @@ class PredictionMarketResolution(BaseModel):
     timestamp: int = Field(..., description="Resolution timestamp")
     proof_hash: Optional[str] = Field(None, description="Hash of proof data")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
+                "response_type": "resolution",
                 "winning_outcome": 0,
                 "resolution_value": 105000,
                 "confidence": 0.98,
@@ -273,9 +401,11 @@ class PredictionMarketResolution(BaseModel):
                 "proof_hash": "0xa7b4c9d3e2f1a8b5c6d7e8f9a1b2c3d4e5f6a7b8c9d0"
             }
         }
+    )
 
 class OracleDataValidation(BaseModel):
     """JSON schema for validating oracle data quality"""
+    response_type: Literal["validation"] = Field("validation", description="Response type tag")
     is_valid: bool = Field(..., description="Whether data passes validation")
     confidence_score: float = Field(..., ge=0, le=1, description="Data quality confidence")
     anomaly_detected: bool = Field(False, description="Whether anomalies were found")
@@ -284,9 +414,10 @@ class OracleDataValidation(BaseModel):
     issues: List[str] = Field(default_factory=list, description="List of issues found")
     recommendations: List[str] = Field(default_factory=list, description="Recommendations for improvement")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
+                "response_type": "validation",
                 "is_valid": True,
                 "confidence_score": 0.94,
                 "anomaly_detected": False,
@@ -296,9 +427,25 @@ class OracleDataValidation(BaseModel):
                 "recommendations": ["Consider adding more data sources for cross-validation"]
             }
         }
+    )
+
+# Tagged union of the LLM response schemas; pydantic-core dispatches on
+# response_type instead of trying each branch in turn
+LLMResponse = Annotated[
+    Union[OracleRoutingResponse, PredictionMarketResolution, OracleDataValidation],
+    Field(discriminator="response_type")
+]
+LLM_RESPONSE_ADAPTER: TypeAdapter = TypeAdapter(LLMResponse)
 
 # ============ Utility Functions ============
 
+# Fields each Solidity struct must expose, for validate_contract_compatibility
+_EXPECTED_STRUCT_FIELDS: Dict[str, frozenset] = {
+    "OracleData": frozenset({"value", "timestamp", "confidence", "data_id", "source"}),
+    "RouteResult": frozenset({"success", "selected_provider", "oracle_address", "estimated_cost", "reason"}),
+    "Market": frozenset({"market_id", "question", "creator", "end_time", "status"}),
+}
+
 def validate_contract_compatibility(python_schema: BaseModel, solidity_struct: str) -> bool:
     """
     Validate that a Python Pydantic model matches a Solidity struct
@@ -312,37 +459,89 @@ def validate_contract_compatibility(python_schema: BaseModel, solidity_struct: s
     """
     # This would need actual ABI parsing in production
     # For now, it's a placeholder that validates basic structure
-    
-    schema_dict = python_schema.model_json_schema()
-    required_fields = schema_dict.get('required', [])
+    schema_class = python_schema if isinstance(python_schema, type) else type(python_schema)
+    required_fields = _required_fields(schema_class)
     
     # Basic validation - ensure all required fields exist
-    if len(required_fields) == 0:
+    if not required_fields:
         return False
-        
+    
     # Contract-specific validations
-    if solidity_struct == "OracleData":
-        expected_fields = {"value", "timestamp", "confidence", "data_id", "source"}
-        return set(required_fields).issuperset(expected_fields)
-    elif solidity_struct == "RouteResult":
-        expected_fields = {"success", "selected_provider", "oracle_address", "estimated_cost", "reason"}
-        return set(required_fields).issuperset(expected_fields)
-    elif solidity_struct == "Market":
-        expected_fields = {"market_id", "question", "creator", "end_time", "status"}
-        return set(required_fields).issuperset(expected_fields)
-    
-    return True
+    expected_fields = _EXPECTED_STRUCT_FIELDS.get(solidity_struct)
+    return expected_fields is None or required_fields >= expected_fields
+
+# One pattern per hex width, matching a newline-terminated run of values
+_HEX_BATCH_PATTERNS = {
+    width: re.compile(rf'(?:0x[0-9a-fA-F]{{{width}}}\n)*')
+    for width in (40, 64)
+}
+
+def _validate_hex_batch(values: List[str], width: int) -> List[bool]:
+    """Check a batch of 0x-prefixed hex strings of a fixed digit width"""
+    # Fast path: one regex pass over the whole batch. The length check rules
+    # out values smuggling extra newline-separated entries.
+    joined = "\n".join(values) + "\n"
+    pattern = _HEX_BATCH_PATTERNS[width]
+    if len(joined) == (width + 3) * len(values) and pattern.fullmatch(joined):
+        return [True] * len(values)
+    
+    return [pattern.fullmatch(value + "\n") is not None and "\n" not in value for value in values]
+
+def validate_addresses_batch(addresses: List[str]) -> List[bool]:
+    """Validate many Ethereum addresses at once (0x + 40 hex chars)"""
+    return _validate_hex_batch(addresses, 40)
+
+def validate_bytes32_batch(values: List[str]) -> List[bool]:
+    """Validate many bytes32 hex values at once (0x + 64 hex chars)"""
+    return _validate_hex_batch(values, 64)
+
+@lru_cache(maxsize=64)
+def _required_fields(schema_class: type[BaseModel]) -> frozenset:
+    """Required JSON-schema fields of a model class"""
+    return frozenset(schema_class.model_json_schema().get('required', []))
+
+def parse_response(schema_class: type[BaseModel], raw: Union[str, bytes]) -> BaseModel:
+    """
+    Parse and validate a raw JSON response in a single pass
+    
+    Uses model_validate_json, so no intermediate Python dict is built.
+    
+    Args:
+        schema_class: Pydantic model class for expected output
+        raw: JSON text returned by the LLM
+        
+    Returns:
+        BaseModel: Validated schema instance
+    """
+    return schema_class.model_validate_json(raw)
+
+def _dumps(obj: Any) -> str:
+    """Pretty-print JSON with orjson, falling back to json for uint256-sized ints"""
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    except orjson.JSONEncodeError:
+        # orjson only handles 64-bit integers; wei amounts routinely exceed that
+        return json.dumps(obj, indent=2)
 
 def generate_json_schema_for_llm(schema_class: type[BaseModel]) -> str:
     """
     Generate a JSON schema string optimized for LLM consumption
     
+    Registered schemas are served from strings built at import time.
+    
     Args:
         schema_class: Pydantic model class
         
     Returns:
         str: JSON schema as string for LLM prompts
     """
+    schema_str = _LLM_SCHEMAS.get(schema_class)
+    if schema_str is None:
+        schema_str = _LLM_SCHEMAS[schema_class] = _build_llm_schema(schema_class)
+    return schema_str
+
+def _build_llm_schema(schema_class: type[BaseModel]) -> str:
+    """Simplified JSON schema string for one model class"""
     schema = schema_class.model_json_schema()
     
     # Simplify schema for LLM consumption
@@ -361,8 +560,30 @@ def generate_json_schema_for_llm(schema_class: type[BaseModel]) -> str:
         # Add enum values if present
         if "enum" in field_schema:
             simplified["properties"][field_name]["enum"] = field_schema["enum"]
+        
+        # Discriminator tags must always be sent so tagged-union parsing can dispatch
+        if "const" in field_schema:
+            simplified["properties"][field_name]["enum"] = [field_schema["const"]]
+            simplified["required"].append(field_name)
     
-    return json.dumps(simplified, indent=2)
+    return _dumps(simplified)
+
+# Shared prompt scaffold; filled with a single substitute() per call
+_PROMPT_TEMPLATE = string.Template("""Task: $task
+
+You must respond with valid JSON that exactly matches this schema:
+
+$schema
+
+Requirements:
+- All fields marked as required must be present
+- Follow the exact field names and types specified
+- Ensure enum values match exactly (case-sensitive)
+- Addresses must be valid Ethereum addresses (0x + 40 hex chars)
+- Bytes32 values must be 0x + 64 hex chars
+- Confidence scores must be between 0 and 1
+
+${examples}Respond with valid JSON only. Do not include any additional text or explanation.""")
 
 def create_llm_prompt_with_schema(
     task_description: str,
@@ -380,32 +601,18 @@ def create_llm_prompt_with_schema(
     Returns:
         str: Complete prompt with schema
     """
-    schema_str = generate_json_schema_for_llm(schema_class)
-    
-    prompt = f"""Task: {task_description}
-
-You must respond with valid JSON that exactly matches this schema:
-
-{schema_str}
-
-Requirements:
-- All fields marked as required must be present
-- Follow the exact field names and types specified
-- Ensure enum values match exactly (case-sensitive)
-- Addresses must be valid Ethereum addresses (0x + 40 hex chars)
-- Bytes32 values must be 0x + 64 hex chars
-- Confidence scores must be between 0 and 1
-
-"""
-
+    examples_str = ""
     if examples:
-        prompt += "Examples of valid responses:\n\n"
-        for i, example in enumerate(examples):
-            prompt += f"Example {i+1}:\n{json.dumps(example, indent=2)}\n\n"
-    
-    prompt += "Respond with valid JSON only. Do not include any additional text or explanation."
+        examples_str = "Examples of valid responses:\n\n" + "".join(
+            f"Example {i+1}:\n{_dumps(example)}\n\n"
+            for i, example in enumerate(examples)
+        )
     
-    return prompt
+    return _PROMPT_TEMPLATE.substitute(
+        task=task_description,
+        schema=generate_json_schema_for_llm(schema_class),
+        examples=examples_str
+    )
 
 # ============ Export Schema Registry ============
 
@@ -429,10 +636,70 @@ CONTRACT_SCHEMAS = {
     "OracleDataValidation": OracleDataValidation
 }
 
+# LLM schema strings for every registered model, built once at import
+_LLM_SCHEMAS: Dict[type[BaseModel], str] = {
+    schema_class: _build_llm_schema(schema_class)
+    for schema_class in CONTRACT_SCHEMAS.values()
+}
+
 def get_schema(schema_name: str) -> type[BaseModel]:
     """Get a schema class by name"""
     return CONTRACT_SCHEMAS[schema_name]
 
+@lru_cache(maxsize=64)
+def _adapter_for(schema_class: type[BaseModel]) -> TypeAdapter:
+    """TypeAdapter for a schema class, built once and reused"""
+    return TypeAdapter(schema_class)
+
+def validate_by_name(schema_name: str, data: Any) -> BaseModel:
+    """Validate Python data against a schema by name"""
+    return _adapter_for(CONTRACT_SCHEMAS[schema_name]).validate_python(data)
+
+def validate_json_by_name(schema_name: str, raw: Union[str, bytes]) -> BaseModel:
+    """Validate raw JSON against a schema by name in a single pass"""
+    return parse_response(CONTRACT_SCHEMAS[schema_name], raw)
+
+def construct_schema(schema_name: str, data: Dict[str, Any]) -> BaseModel:
+    """
+    Build a schema instance by name without running validation
+    
+    Only for trusted, already-validated data (e.g. re-hydrated on-chain
+    events or cached records). Raw LLM output must go through model_validate.
+    
+    Args:
+        schema_name: Name of the schema in CONTRACT_SCHEMAS
+        data: Field values keyed by field name
+        
+    Returns:
+        BaseModel: Unvalidated schema instance
+    """
+    return CONTRACT_SCHEMAS[schema_name].model_construct(**data)
+
+@lru_cache(maxsize=64)
+def _list_adapter_for(schema_class: type[BaseModel]) -> TypeAdapter:
+    """TypeAdapter for a list of a schema class, built once and reused"""
+    return TypeAdapter(List[schema_class])
+
+def validate_batch(schema_name: str, raw: Union[str, bytes]) -> List[BaseModel]:
+    """
+    Validate a JSON array of records against a schema by name
+    
+    pydantic-core parses the array and builds every instance in one call,
+    instead of a Python loop of per-record model_validate calls.
+    
+    Args:
+        schema_name: Name of the schema in CONTRACT_SCHEMAS
+        raw: JSON array text
+        
+    Returns:
+        List[BaseModel]: Validated schema instances
+    """
+    return _list_adapter_for(CONTRACT_SCHEMAS[schema_name]).validate_json(raw)
+
+def parse_llm_response(raw: Union[str, bytes]) -> BaseModel:
+    """Parse any LLM response schema, selected by its response_type tag"""
+    return LLM_RESPONSE_ADAPTER.validate_json(raw)
+
 def list_available_schemas() -> List[str]:
     """List all available schema names"""
     return list(CONTRACT_SCHEMAS.keys())
\ No newline at end of file
@@ -5,11 +5,15 @@ Provides Pydantic models that exactly match the smart contract structures
 for seamless interaction between AI-generated data and blockchain contracts.
 """
 
-from typing import List, Optional, Dict, Any, Literal, Union
-from datetime import datetime
-from decimal import Decimal
+import heapq
+from array import array
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Annotated, List, Mapping, Optional, Dict, Any, NamedTuple, Sequence, Tuple, Type, Union
 from enum import Enum
-from pydantic import BaseModel, Field, validator, root_validator
+from pydantic import (
+    BaseModel, ConfigDict, Field, StringConstraints, TypeAdapter, model_validator
+)
 
 # ============ Base Contract Enums ============
 
@@ -36,10 +40,149 @@ class BettingTier(str, Enum):
     NORMAL = "normal"            # 1.1x bonus (30-60% of duration)
     BASE = "base"                # 1.0x (60-100% of duration)
 
+# Shared field constraints, so each builds a single core schema
+OptionIndex = Annotated[int, Field(ge=0, le=4)]
+TokenUnits = Annotated[int, Field(gt=0)]
+
+# Option text length is checked on the stripped value inside pydantic-core
+OptionText = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=100)]
+
+# ============ Schema Examples ============
+
+_TOKEN_CONFIG_EXAMPLE = {
+    "is_accepted": True,
+    "min_bet": 1000000,  # $1 USDC (6 decimals)
+    "max_bet": 10000000000,  # $10,000 USDC 
+    "decimals": 6,
+    "symbol": "USDC",
+    "total_volume": 0,
+    "contract_address": "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
+}
+
+_USER_BET_EXAMPLE = {
+    "option": 0,
+    "amount": 5000000,  # $5 USDC
+    "weighted_amount": 7500000,  # $7.50 with 1.5x early bird bonus
+    "timestamp": 1703097600,
+    "has_voted": True,
+    "tier": "early_bird",
+    "multiplier": 1.5
+}
+
+_POLL_OPTION_EXAMPLE = {
+    "index": 0,
+    "text": "Price will rise 10%+",
+    "pool": 25000000,  # $25 USDC
+    "weighted_pool": 35000000,  # $35 USDC weighted
+    "percentage": 35.0
+}
+
+_POLL_EXAMPLE = {
+    "poll_id": 123,
+    "article_url": "https://coindesk.com/bitcoin-price-analysis",
+    "question": "Will Bitcoin exceed $100,000 by end of 2024?",
+    "options": [
+        {
+            "index": 0,
+            "text": "Yes, BTC > $100k",
+            "pool": 50000000,
+            "weighted_pool": 65000000,
+            "percentage": 65.0
+        },
+        {
+            "index": 1, 
+            "text": "No, BTC < $100k",
+            "pool": 35000000,
+            "weighted_pool": 35000000,
+            "percentage": 35.0
+        }
+    ],
+    "payment_token": "USDC",
+    "token_symbol": "USDC",
+    "start_time": 1703097600,
+    "end_time": 1703184000,
+    "duration": 86400,
+    "total_pool": 85000000,
+    "platform_fee": 2125000,
+    "creator_reward": 0,
+    "early_bird_cutoff": 1703106240,
+    "quick_cutoff": 1703123520,
+    "normal_cutoff": 1703149440,
+    "resolved": False,
+    "winning_option": None,
+    "was_cancelled": False,
+    "was_refunded": False,
+    "creator": "0x742d35Cc6634C0532925a3b8D0Ac5f06eDd5C0L2",
+    "participants": [],
+    "participant_count": 0
+}
+
+_POLL_CREATION_REQUEST_EXAMPLE = {
+    "article_url": "https://techcrunch.com/ai-breakthrough",
+    "question": "Will this AI company IPO within 12 months?",
+    "options": ["Yes, within 12 months", "No, will take longer"],
+    "payment_token": "USDC",
+    "duration": 172800,  # 48 hours
+    "creator_reward_enabled": False
+}
+
+_BET_REQUEST_EXAMPLE = {
+    "poll_id": 123,
+    "option": 0,
+    "amount": 10000000,  # $10 USDC
+    "expected_tier": "early_bird",
+    "expected_multiplier": 1.5,
+    "max_slippage": 0.01
+}
+
+_CLAIM_REQUEST_EXAMPLE = {
+    "poll_id": 123
+}
+
+_TRANSACTION_RESPONSE_EXAMPLE = {
+    "success": True,
+    "transaction_hash": "0xabc123...",
+    "gas_used": 150000,
+    "gas_price": 2000000000,  # 2 gwei
+    "block_number": 12345678,
+    "poll_id": 123,
+    "error_message": None
+}
+
+_POLL_STATE_EXAMPLE = {
+    "poll": {"poll_id": 123},  # Full poll object
+    "current_tier": "quick",
+    "current_multiplier": 1.3,
+    "time_remaining": 43200,  # 12 hours
+    "can_bet": True,
+    "total_bettors": 25
+}
+
+_ORACLE_RESOLUTION_REQUEST_EXAMPLE = {
+    "poll_id": 123,
+    "resolution_data": {
+        "bitcoin_price": 105000,
+        "data_source": "coinbase",
+        "timestamp": 1703097600
+    },
+    "oracle_provider": "chainlink",
+    "confidence_threshold": 0.9
+}
+
+_ORACLE_RESOLUTION_RESPONSE_EXAMPLE = {
+    "poll_id": 123,
+    "winning_option": 0,
+    "confidence": 0.95,
+    "data_sources": ["coinbase", "binance", "kraken"],
+    "resolution_timestamp": 1703097600
+}
+
 # ============ Contract Structure Models ============
 
 class TokenConfig(BaseModel):
     """Token configuration matching contract TokenConfig struct"""
+    model_config = ConfigDict(json_schema_extra={"example": _TOKEN_CONFIG_EXAMPLE})
+    
     is_accepted: bool = Field(..., description="Whether token is accepted")
     min_bet: int = Field(..., description="Minimum bet in token units")
     max_bet: int = Field(..., description="Maximum bet in token units")  
@@ -49,24 +192,13 @@ class TokenConfig(BaseModel):
     
     # Contract addresses on Base
     contract_address: Optional[str] = Field(None, description="Token contract address")
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "is_accepted": True,
-                "min_bet": 1000000,  # $1 USDC (6 decimals)
-                "max_bet": 10000000000,  # $10,000 USDC 
-                "decimals": 6,
-                "symbol": "USDC",
-                "total_volume": 0,
-                "contract_address": "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
-            }
-        }
 
 class UserBet(BaseModel):
     """User bet details matching contract UserBet struct"""
-    option: int = Field(..., ge=0, le=4, description="Option index (0-4)")
-    amount: int = Field(..., gt=0, description="Bet amount in token units")
+    model_config = ConfigDict(json_schema_extra={"example": _USER_BET_EXAMPLE})
+    
+    option: OptionIndex = Field(..., description="Option index (0-4)")
+    amount: TokenUnits = Field(..., description="Bet amount in token units")
     weighted_amount: int = Field(..., description="Amount after time multiplier")
     timestamp: int = Field(..., description="Unix timestamp of bet")
     has_voted: bool = Field(True, description="Whether user has voted (always true for bets)")
@@ -75,46 +207,52 @@ class UserBet(BaseModel):
     tier: Optional[BettingTier] = Field(None, description="Which time tier this bet falls into")
     multiplier: Optional[float] = Field(None, description="Time multiplier applied (1.0-1.5)")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "option": 0,
-                "amount": 5000000,  # $5 USDC
-                "weighted_amount": 7500000,  # $7.50 with 1.5x early bird bonus
-                "timestamp": 1703097600,
-                "has_voted": True,
-                "tier": "early_bird",
-                "multiplier": 1.5
-            }
-        }
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> 'UserBet':
+        """Build without validation; only for already-validated or on-chain decoded data"""
+        return cls.model_construct(**data)
 
 class PollOption(BaseModel):
     """Individual poll option with betting pools"""
-    index: int = Field(..., ge=0, le=4, description="Option index")
+    model_config = ConfigDict(json_schema_extra={"example": _POLL_OPTION_EXAMPLE})
+    
+    index: OptionIndex = Field(..., description="Option index")
     text: str = Field(..., min_length=1, max_length=100, description="Option text")
     pool: int = Field(0, description="Total pool for this option")
     weighted_pool: int = Field(0, description="Weighted pool (with time multipliers)")
     percentage: Optional[float] = Field(None, ge=0, le=100, description="Pool percentage")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "index": 0,
-                "text": "Price will rise 10%+",
-                "pool": 25000000,  # $25 USDC
-                "weighted_pool": 35000000,  # $35 USDC weighted
-                "percentage": 35.0
-            }
-        }
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> 'PollOption':
+        """Build without validation; only for already-validated or on-chain decoded data"""
+        return cls.model_construct(**data)
+    
+    @classmethod
+    def from_lite(cls, option: 'PollOptionLite') -> 'PollOption':
+        """Convert a PollOptionLite at the API boundary (trusted, not re-validated)"""
+        return cls.model_construct(**option._asdict())
+    
+    def to_lite(self) -> 'PollOptionLite':
+        """Convert to a PollOptionLite for in-memory recalculation"""
+        return PollOptionLite(self.index, self.text, self.pool, self.weighted_pool, self.percentage)
+
+class PollOptionLite(NamedTuple):
+    """Immutable, unvalidated PollOption for pool recalculation inner loops"""
+    index: int
+    text: str
+    pool: int = 0
+    weighted_pool: int = 0
+    percentage: Optional[float] = None
 
 class Poll(BaseModel):
     """Complete poll structure matching contract Poll struct"""
+    model_config = ConfigDict(json_schema_extra={"example": _POLL_EXAMPLE})
     
     # Core poll data
     poll_id: int = Field(..., ge=0, description="Unique poll identifier")
     article_url: str = Field(..., description="Source article URL")
     question: str = Field(..., min_length=10, max_length=500, description="Poll question")
-    options: List[PollOption] = Field(..., min_items=2, max_items=5, description="Poll options")
+    options: List[PollOption] = Field(..., min_length=2, max_length=5, description="Poll options")
     
     # Token and timing
     payment_token: TokenType = Field(..., description="Accepted payment token")
@@ -135,141 +273,100 @@ class Poll(BaseModel):
     
     # Resolution data
     resolved: bool = Field(False, description="Whether poll is resolved")
-    winning_option: Optional[int] = Field(None, ge=0, le=4, description="Winning option index")
+    winning_option: Optional[OptionIndex] = Field(None, description="Winning option index")
     was_cancelled: bool = Field(False, description="Whether poll was cancelled")
     was_refunded: bool = Field(False, description="Whether single participant refund occurred")
     
     # Creator and participant data
     creator: str = Field(..., description="Creator wallet address")
-    participants: List[str] = Field(default_factory=list, description="List of participant addresses")
+    participants: List[str] = Field(default_factory=list, description="Participant addresses in join order")
     participant_count: int = Field(0, description="Number of unique participants")
     
-    @validator('options')
-    def validate_options(cls, v):
-        if not (2 <= len(v) <= 5):
-            raise ValueError('Poll must have 2-5 options')
-        return v
+    @model_validator(mode='before')
+    @classmethod
+    def default_participant_count(cls, data: Any) -> Any:
+        """Derive participant_count from participants when it isn't given"""
+        if isinstance(data, dict) and 'participant_count' not in data and data.get('participants'):
+            data = {**data, 'participant_count': len(set(data['participants']))}
+        return data
     
-    @validator('end_time', pre=False, always=True)
-    def validate_timing(cls, v, values):
-        start_time = values.get('start_time', 0)
-        if v <= start_time:
+    @model_validator(mode='after')
+    def validate_timing(self) -> 'Poll':
+        if self.end_time <= self.start_time:
             raise ValueError('End time must be after start time')
-        return v
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "poll_id": 123,
-                "article_url": "https://coindesk.com/bitcoin-price-analysis",
-                "question": "Will Bitcoin exceed $100,000 by end of 2024?",
-                "options": [
-                    {
-                        "index": 0,
-                        "text": "Yes, BTC > $100k",
-                        "pool": 50000000,
-                        "weighted_pool": 65000000,
-                        "percentage": 65.0
-                    },
-                    {
-                        "index": 1, 
-                        "text": "No, BTC < $100k",
-                        "pool": 35000000,
-                        "weighted_pool": 35000000,
-                        "percentage": 35.0
-                    }
-                ],
-                "payment_token": "USDC",
-                "token_symbol": "USDC",
-                "start_time": 1703097600,
-                "end_time": 1703184000,
-                "duration": 86400,
-                "total_pool": 85000000,
-                "platform_fee": 2125000,
-                "creator_reward": 0,
-                "early_bird_cutoff": 1703106240,
-                "quick_cutoff": 1703123520,
-                "normal_cutoff": 1703149440,
-                "resolved": False,
-                "winning_option": None,
-                "was_cancelled": False,
-                "was_refunded": False,
-                "creator": "0x742d35Cc6634C0532925a3b8D0Ac5f06eDd5C0L2",
-                "participants": [],
-                "participant_count": 0
-            }
-        }
+        return self
+    
+    def tier_at(self, now: int) -> Tuple[BettingTier, float]:
+        """Time tier and multiplier at a timestamp, from the stored cutoffs"""
+        return _TIER_TABLE[
+            (now > self.early_bird_cutoff) + (now > self.quick_cutoff) + (now > self.normal_cutoff)
+        ]
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes for network clients, without a str round-trip"""
+        return self.__pydantic_serializer__.to_json(self)
+    
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> 'Poll':
+        """
+        Build without validation; only for already-validated or on-chain decoded data
+        
+        External/API input must go through Poll(**data) so the option and
+        timing checks run.
+        """
+        options = [
+            PollOption.model_construct(**option) if isinstance(option, dict) else option
+            for option in data.get('options', ())
+        ]
+        return cls.model_construct(**{
+            **cls.default_participant_count(data),
+            'options': options
+        })
 
 # ============ Transaction Models ============
 
 class PollCreationRequest(BaseModel):
     """Request to create a new poll (matches contract createPoll function)"""
+    model_config = ConfigDict(json_schema_extra={"example": _POLL_CREATION_REQUEST_EXAMPLE})
+    
     article_url: str = Field(..., description="Source article URL")
     question: str = Field(..., min_length=10, max_length=500, description="Poll question")
-    options: List[str] = Field(..., min_items=2, max_items=5, description="Option texts")
+    options: List[OptionText] = Field(..., min_length=2, max_length=5, description="Option texts")
     payment_token: TokenType = Field(..., description="Accepted payment token") 
     duration: int = Field(86400, ge=86400, le=345600, description="Duration in seconds")
     
     # Optional creator settings
     creator_reward_enabled: bool = Field(False, description="Whether to enable creator rewards")
-    
-    @validator('options')
-    def validate_options_length(cls, v):
-        for option in v:
-            if not (1 <= len(option.strip()) <= 100):
-                raise ValueError('Each option must be 1-100 characters')
-        return v
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "article_url": "https://techcrunch.com/ai-breakthrough",
-                "question": "Will this AI company IPO within 12 months?",
-                "options": ["Yes, within 12 months", "No, will take longer"],
-                "payment_token": "USDC",
-                "duration": 172800,  # 48 hours
-                "creator_reward_enabled": False
-            }
-        }
 
 class BetRequest(BaseModel):
     """Request to place a bet (matches contract placeBet function)"""
+    model_config = ConfigDict(json_schema_extra={"example": _BET_REQUEST_EXAMPLE})
+    
     poll_id: int = Field(..., ge=0, description="Poll ID to bet on")
-    option: int = Field(..., ge=0, le=4, description="Option to bet on (0-4)")
-    amount: int = Field(..., gt=0, description="Bet amount in token units")
+    option: OptionIndex = Field(..., description="Option to bet on (0-4)")
+    amount: TokenUnits = Field(..., description="Bet amount in token units")
     
     # For SDK convenience - these will be calculated
     expected_tier: Optional[BettingTier] = Field(None, description="Expected time tier")
     expected_multiplier: Optional[float] = Field(None, description="Expected multiplier")
     max_slippage: Optional[float] = Field(0.01, description="Max acceptable tier slippage")
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "poll_id": 123,
-                "option": 0,
-                "amount": 10000000,  # $10 USDC
-                "expected_tier": "early_bird",
-                "expected_multiplier": 1.5,
-                "max_slippage": 0.01
-            }
-        }
 
 class ClaimRequest(BaseModel):
     """Request to claim winnings (matches contract claimWinnings function)"""
-    poll_id: int = Field(..., ge=0, description="Poll ID to claim from")
+    model_config = ConfigDict(json_schema_extra={"example": _CLAIM_REQUEST_EXAMPLE})
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "poll_id": 123
-            }
-        }
+    poll_id: int = Field(..., ge=0, description="Poll ID to claim from")
 
 # ============ Response Models ============
 
 class TransactionResponse(BaseModel):
     """Response from contract transaction"""
+    model_config = ConfigDict(
+        frozen=True,
+        validate_assignment=False,
+        json_schema_extra={"example": _TRANSACTION_RESPONSE_EXAMPLE}
+    )
+    
     success: bool = Field(..., description="Whether transaction succeeded")
     transaction_hash: Optional[str] = Field(None, description="Transaction hash")
     gas_used: Optional[int] = Field(None, description="Gas used")
@@ -280,21 +377,19 @@ class TransactionResponse(BaseModel):
     poll_id: Optional[int] = Field(None, description="Poll ID (for creation)")
     error_message: Optional[str] = Field(None, description="Error message if failed")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "success": True,
-                "transaction_hash": "0xabc123...",
-                "gas_used": 150000,
-                "gas_price": 2000000000,  # 2 gwei
-                "block_number": 12345678,
-                "poll_id": 123,
-                "error_message": None
-            }
-        }
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> 'TransactionResponse':
+        """Build without validation; only for already-validated or on-chain decoded data"""
+        return cls.model_construct(**data)
 
 class PollState(BaseModel):
     """Current poll state for display"""
+    model_config = ConfigDict(
+        frozen=True,
+        validate_assignment=False,
+        json_schema_extra={"example": _POLL_STATE_EXAMPLE}
+    )
+    
     poll: Poll = Field(..., description="Poll data")
     current_tier: BettingTier = Field(..., description="Current time tier")
     current_multiplier: float = Field(..., description="Current time multiplier")
@@ -302,132 +397,237 @@ class PollState(BaseModel):
     can_bet: bool = Field(..., description="Whether betting is still allowed")
     total_bettors: int = Field(..., description="Number of unique bettors")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "poll": {"poll_id": 123},  # Full poll object
-                "current_tier": "quick",
-                "current_multiplier": 1.3,
-                "time_remaining": 43200,  # 12 hours
-                "can_bet": True,
-                "total_bettors": 25
-            }
-        }
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes for network clients, without a str round-trip"""
+        return self.__pydantic_serializer__.to_json(self)
+    
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> 'PollState':
+        """Build without validation; only for already-validated or on-chain decoded data"""
+        poll = data.get('poll')
+        if isinstance(poll, dict):
+            data = {**data, 'poll': Poll.from_trusted(poll)}
+        return cls.model_construct(**data)
 
 # ============ Oracle Integration Models ============
 
 class OracleResolutionRequest(BaseModel):
     """Request for oracle to resolve a poll"""
+    model_config = ConfigDict(json_schema_extra={"example": _ORACLE_RESOLUTION_REQUEST_EXAMPLE})
+    
     poll_id: int = Field(..., ge=0, description="Poll to resolve")
     resolution_data: Dict[str, Any] = Field(..., description="Data needed for resolution")
     oracle_provider: str = Field(..., description="Oracle provider to use")
     confidence_threshold: float = Field(0.8, ge=0.5, le=1.0, description="Minimum confidence")
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "poll_id": 123,
-                "resolution_data": {
-                    "bitcoin_price": 105000,
-                    "data_source": "coinbase",
-                    "timestamp": 1703097600
-                },
-                "oracle_provider": "chainlink",
-                "confidence_threshold": 0.9
-            }
-        }
 
 class OracleResolutionResponse(BaseModel):
     """Oracle resolution response"""
+    model_config = ConfigDict(
+        frozen=True,
+        validate_assignment=False,
+        json_schema_extra={"example": _ORACLE_RESOLUTION_RESPONSE_EXAMPLE}
+    )
+    
     poll_id: int = Field(..., description="Resolved poll ID")
-    winning_option: int = Field(..., ge=0, le=4, description="Winning option index")
+    winning_option: OptionIndex = Field(..., description="Winning option index")
     confidence: float = Field(..., ge=0, le=1, description="Oracle confidence")
     data_sources: List[str] = Field(..., description="Data sources used")
     resolution_timestamp: int = Field(..., description="Resolution timestamp")
+
+# ============ Batch Structures ============
+
+class PollTable:
+    """
+    Column-oriented view over a list of polls for dashboard queries
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "poll_id": 123,
-                "winning_option": 0,
-                "confidence": 0.95,
-                "data_sources": ["coinbase", "binance", "kraken"],
-                "resolution_timestamp": 1703097600
-            }
-        }
+    Timestamps and ids are packed into typed arrays once, so filters scan
+    flat columns instead of loading attributes from each Poll. Matching
+    Poll objects are only looked up when a query returns.
+    """
+    __slots__ = ('poll_id', 'start_time', 'end_time', 'total_pool', 'token_code', '_polls')
+    
+    # Stable small-int code per payment token
+    _TOKEN_CODES: Mapping[TokenType, int] = MappingProxyType(
+        {token: code for code, token in enumerate(TokenType)}
+    )
+    
+    def __init__(self, polls: List[Poll]):
+        self._polls = polls
+        self.poll_id = array('q', [poll.poll_id for poll in polls])
+        self.start_time = array('q', [poll.start_time for poll in polls])
+        self.end_time = array('q', [poll.end_time for poll in polls])
+        # Pools are wei-scale and can exceed int64, so they stay Python ints
+        self.total_pool = [poll.total_pool for poll in polls]
+        self.token_code = array('b', [self._TOKEN_CODES[poll.payment_token] for poll in polls])
+    
+    def __len__(self) -> int:
+        return len(self._polls)
+    
+    def active_at(self, now: int) -> List[Poll]:
+        """Polls whose betting window contains now"""
+        polls = self._polls
+        return [
+            polls[i] for i, (start, end) in enumerate(zip(self.start_time, self.end_time))
+            if start <= now < end
+        ]
+    
+    def by_token(self, token_type: TokenType) -> List[Poll]:
+        """Polls paid in the given token"""
+        code = self._TOKEN_CODES[token_type]
+        polls = self._polls
+        return [polls[i] for i, token in enumerate(self.token_code) if token == code]
+    
+    def top_by_pool(self, k: int) -> List[Poll]:
+        """The k polls with the largest total pool"""
+        pools = self.total_pool
+        return [self._polls[i] for i in heapq.nlargest(k, range(len(pools)), key=pools.__getitem__)]
+    
+    def tiers_at(self, now: int) -> List[Tuple[BettingTier, float]]:
+        """Time tier and multiplier of every poll at now"""
+        return calculate_time_tiers_batch(self.start_time, self.end_time, now)
 
 # ============ Utility Functions ============
 
-def get_token_config_by_type(token_type: TokenType) -> Dict[str, Any]:
+# Default token configurations, built once at import (read-only)
+_TOKEN_CONFIGS: Mapping[TokenType, Mapping[str, Any]] = MappingProxyType({
+    TokenType.NATIVE_ETH: MappingProxyType({
+        "contract_address": "0x0000000000000000000000000000000000000000",
+        "decimals": 18,
+        "symbol": "ETH",
+        "min_bet": 1000000000000000,  # 0.001 ETH
+        "max_bet": 10000000000000000000  # 10 ETH
+    }),
+    TokenType.USDC: MappingProxyType({
+        "contract_address": "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
+        "decimals": 6,
+        "symbol": "USDC", 
+        "min_bet": 1000000,  # $1 USDC
+        "max_bet": 10000000000  # $10,000 USDC
+    }),
+    TokenType.PYUSD: MappingProxyType({
+        "contract_address": "0xcAa940d48B22b8F3fb53b7d5Eb0a0E43bC261d3C",
+        "decimals": 6,
+        "symbol": "PYUSD",
+        "min_bet": 1000000,  # $1 PYUSD
+        "max_bet": 10000000000  # $10,000 PYUSD
+    }),
+    TokenType.CBETH: MappingProxyType({
+        "contract_address": "0x2Ae3F1Ec7F1F5012CFEab0185bfc7aa3cf0DEc22",
+        "decimals": 18, 
+        "symbol": "cbETH",
+        "min_bet": 1000000000000000,  # 0.001 cbETH
+        "max_bet": 10000000000000000000  # 10 cbETH
+    }),
+    TokenType.WETH: MappingProxyType({
+        "contract_address": "0x4200000000000000000000000000000000000006",
+        "decimals": 18,
+        "symbol": "WETH",
+        "min_bet": 1000000000000000,  # 0.001 WETH
+        "max_bet": 10000000000000000000  # 10 WETH
+    })
+})
+_EMPTY_CONFIG: Mapping[str, Any] = MappingProxyType({})
+
+def get_token_config_by_type(token_type: TokenType) -> Mapping[str, Any]:
     """Get default token configuration by type"""
-    configs = {
-        TokenType.NATIVE_ETH: {
-            "contract_address": "0x0000000000000000000000000000000000000000",
-            "decimals": 18,
-            "symbol": "ETH",
-            "min_bet": 1000000000000000,  # 0.001 ETH
-            "max_bet": 10000000000000000000  # 10 ETH
-        },
-        TokenType.USDC: {
-            "contract_address": "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
-            "decimals": 6,
-            "symbol": "USDC", 
-            "min_bet": 1000000,  # $1 USDC
-            "max_bet": 10000000000  # $10,000 USDC
-        },
-        TokenType.PYUSD: {
-            "contract_address": "0xcAa940d48B22b8F3fb53b7d5Eb0a0E43bC261d3C",
-            "decimals": 6,
-            "symbol": "PYUSD",
-            "min_bet": 1000000,  # $1 PYUSD
-            "max_bet": 10000000000  # $10,000 PYUSD
-        },
-        TokenType.CBETH: {
-            "contract_address": "0x2Ae3F1Ec7F1F5012CFEab0185bfc7aa3cf0DEc22",
-            "decimals": 18, 
-            "symbol": "cbETH",
-            "min_bet": 1000000000000000,  # 0.001 cbETH
-            "max_bet": 10000000000000000000  # 10 cbETH
-        },
-        TokenType.WETH: {
-            "contract_address": "0x4200000000000000000000000000000000000006",
-            "decimals": 18,
-            "symbol": "WETH",
-            "min_bet": 1000000000000000,  # 0.001 WETH
-            "max_bet": 10000000000000000000  # 10 WETH
-        }
-    }
-    return configs.get(token_type, {})
+    return _TOKEN_CONFIGS.get(token_type, _EMPTY_CONFIG)
 
-def calculate_time_tier(start_time: int, end_time: int, current_time: int) -> tuple[BettingTier, float]:
+# (tier, multiplier) indexed by how many of the 10%/30%/60% marks have passed
+_TIER_TABLE: Tuple[Tuple[BettingTier, float], ...] = (
+    (BettingTier.EARLY_BIRD, 1.5),
+    (BettingTier.QUICK, 1.3),
+    (BettingTier.NORMAL, 1.1),
+    (BettingTier.BASE, 1.0)
+)
+
+def calculate_time_tier(start_time: int, end_time: int, current_time: int) -> Tuple[BettingTier, float]:
     """Calculate current time tier and multiplier"""
-    duration = end_time - start_time
-    elapsed = current_time - start_time
-    progress = elapsed / duration
-    
-    if progress <= 0.1:
-        return BettingTier.EARLY_BIRD, 1.5
-    elif progress <= 0.3:
-        return BettingTier.QUICK, 1.3
-    elif progress <= 0.6:
-        return BettingTier.NORMAL, 1.1
-    else:
-        return BettingTier.BASE, 1.0
+    # Integer comparisons against the progress marks; no division or branches
+    duration = max(end_time - start_time, 1)
+    elapsed = (current_time - start_time) * 10
+    return _TIER_TABLE[
+        (elapsed > duration) + (elapsed > 3 * duration) + (elapsed > 6 * duration)
+    ]
+
+def calculate_time_tiers_batch(
+    start_times: Sequence[int],
+    end_times: Sequence[int],
+    current_time: int
+) -> List[Tuple[BettingTier, float]]:
+    """
+    Calculate time tier and multiplier for many polls in one pass
+    
+    Progress marks are compared in integer arithmetic, so there is no float
+    division or if/elif chain per poll.
+    
+    Args:
+        start_times: Poll start timestamps
+        end_times: Poll end timestamps, parallel to start_times
+        current_time: Timestamp to evaluate at
+        
+    Returns:
+        List[Tuple[BettingTier, float]]: Tier and multiplier per poll
+    """
+    tiers = []
+    for start_time, end_time in zip(start_times, end_times):
+        duration = max(end_time - start_time, 1)
+        elapsed = (current_time - start_time) * 10
+        tiers.append(_TIER_TABLE[
+            (elapsed > duration) + (elapsed > 3 * duration) + (elapsed > 6 * duration)
+        ])
+    return tiers
+
+@lru_cache(maxsize=None)
+def get_json_schema(schema_class: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    JSON schema for a contract model, generated once per class
+    
+    The returned dict is shared between callers and must not be mutated.
+    """
+    return schema_class.model_json_schema()
 
 def validate_poll_creation_data(data: Dict[str, Any]) -> PollCreationRequest:
     """Validate and parse poll creation data"""
     return PollCreationRequest.model_validate(data)
 
+# Built once so batch ingest reuses the same pydantic-core validators
+_POLL_LIST_ADAPTER: TypeAdapter = TypeAdapter(List[Poll])
+_USER_BET_LIST_ADAPTER: TypeAdapter = TypeAdapter(List[UserBet])
+
+def parse_polls(batch: List[Dict[str, Any]]) -> List[Poll]:
+    """Validate a batch of poll dicts in one pydantic-core call"""
+    return _POLL_LIST_ADAPTER.validate_python(batch)
+
+def parse_polls_json(raw: Union[str, bytes]) -> List[Poll]:
+    """Validate a JSON array of polls straight from the raw payload"""
+    return _POLL_LIST_ADAPTER.validate_json(raw)
+
+def parse_user_bets(batch: List[Dict[str, Any]]) -> List[UserBet]:
+    """Validate a batch of user bet dicts in one pydantic-core call"""
+    return _USER_BET_LIST_ADAPTER.validate_python(batch)
+
+def _display_format(decimals: int, symbol: str) -> Tuple[int, int, int, str, str, str]:
+    """(rounding step, fraction unit, places, prefix, suffix, grouping) for a token"""
+    if decimals == 6:  # USDC, PYUSD
+        places, prefix, suffix, grouping = 2, "$", "", ","
+    else:  # ETH, WETH, cbETH
+        places, prefix, suffix, grouping = 4, "", f" {symbol}", ""
+    return 10 ** (decimals - places), 10 ** places, places, prefix, suffix, grouping
+
+# Everything format_amount_for_display needs per token, resolved once at import
+_DISPLAY_FORMATS: Mapping[TokenType, Tuple[int, int, int, str, str, str]] = MappingProxyType({
+    token_type: _display_format(config['decimals'], config['symbol'])
+    for token_type, config in _TOKEN_CONFIGS.items()
+})
+_DEFAULT_DISPLAY_FORMAT = _display_format(18, 'TOKEN')
+
 def format_amount_for_display(amount: int, token_type: TokenType) -> str:
     """Format token amount for display"""
-    config = get_token_config_by_type(token_type)
-    decimals = config.get('decimals', 18)
-    symbol = config.get('symbol', 'TOKEN')
-    
-    # Convert to decimal and format
-    display_amount = amount / (10 ** decimals)
+    step, unit, places, prefix, suffix, grouping = _DISPLAY_FORMATS.get(
+        token_type, _DEFAULT_DISPLAY_FORMAT
+    )
     
-    if decimals == 6:  # USDC, PYUSD
-        return f"${display_amount:,.2f}"
-    else:  # ETH, WETH, cbETH
-        return f"{display_amount:.4f} {symbol}"
\ No newline at end of file
+    # Integer rounding keeps 18-decimal amounts exact (no float division)
+    sign = "-" if amount < 0 else ""
+    whole, frac = divmod((abs(amount) + step // 2) // step, unit)
+    return f"{prefix}{sign}{whole:{grouping}}.{frac:0{places}d}{suffix}"
@@ -3,14 +3,30 @@ Oracle Provider Schemas for OpenOracle
 Comprehensive Pydantic models for all supported oracle providers
 """
 
-from typing import List, Optional, Dict, Any, Literal, Union
-from datetime import datetime
+from typing import Annotated, FrozenSet, Iterable, List, Optional, Dict, Any, Literal, Sequence, Tuple, Union
+import math
+import statistics
+import sys
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from decimal import Decimal
 from enum import Enum
-from pydantic import BaseModel, Field, validator, root_validator
+from pydantic import (
+    AliasChoices, BaseModel, BeforeValidator, ConfigDict, Discriminator, Field,
+    StringConstraints, Tag, TypeAdapter, model_validator
+)
 
 # ============ Common Enums and Base Models ============
 
+# Core schemas are built on first validation rather than at import, so
+# importing the module only pays for the providers actually used
+_MODEL_CONFIG = ConfigDict(defer_build=True)
+
+# Shared by models built in bulk from oracle responses: immutable, and unknown
+# upstream fields are dropped instead of stored
+_RESPONSE_CONFIG = ConfigDict(frozen=True, extra='ignore', defer_build=True)
+
+
 class OracleProvider(str, Enum):
     """Supported oracle providers"""
     CHAINLINK = "chainlink"
@@ -47,17 +63,103 @@ class UpdateFrequency(str, Enum):
     DAILY = "daily"              # Once per day
     ON_DEMAND = "on_demand"      # Pull-based updates
 
+# Interned enum values for O(1) membership checks on raw strings
+PROVIDER_VALUES: FrozenSet[str] = frozenset(sys.intern(e.value) for e in OracleProvider)
+CATEGORY_VALUES: FrozenSet[str] = frozenset(sys.intern(e.value) for e in DataCategory)
+FREQUENCY_VALUES: FrozenSet[str] = frozenset(sys.intern(e.value) for e in UpdateFrequency)
+
+# Shared field constraints, so each builds a single core schema
+Confidence = Annotated[float, Field(ge=0, le=1)]
+Probability = Confidence  # Same [0, 1] bound, named for rates
+RoundId = Annotated[int, Field(ge=0)]
+Count = Annotated[int, Field(ge=1)]
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_epoch_ms(v: Any) -> Any:
+    """Accept datetimes and ISO strings for epoch-millisecond fields, naive ones as UTC"""
+    if isinstance(v, str) and not v.isdigit():
+        v = datetime.fromisoformat(v.replace('Z', '+00:00'))
+    if isinstance(v, datetime):
+        if v.tzinfo is None:
+            v = v.replace(tzinfo=timezone.utc)
+        # Integer arithmetic, as float timestamps can round .999s down a millisecond
+        return (v - _EPOCH) // timedelta(seconds=1) * 1000 + v.microsecond // 1000
+    return v
+
+
+def _from_epoch_ms(ms: int) -> datetime:
+    """Exact UTC datetime for an epoch-millisecond timestamp"""
+    return _EPOCH + timedelta(milliseconds=ms)
+
+
+# Oracle timestamps kept as Unix epoch milliseconds; datetimes built on access
+EpochMs = Annotated[int, Field(ge=0), BeforeValidator(_to_epoch_ms)]
+
+# Hex formats, matched by pydantic-core's compiled regex
+Address = Annotated[str, StringConstraints(pattern=r'^0x[0-9a-fA-F]{40}$')]
+Bytes32Hex = Annotated[str, StringConstraints(pattern=r'^(0x)?[0-9a-fA-F]{64}$')]
+HexData = Annotated[str, StringConstraints(pattern=r'^(0x)?[0-9a-fA-F]*$')]
+
+# Exact runtime type -> union tag, so value fields dispatch straight to one
+# validator instead of trying every union member
+_VALUE_TAGS: Dict[type, str] = {bool: 'bool', int: 'int', float: 'float', str: 'str', dict: 'dict'}
+
+
+def _value_tag(v: Any) -> Optional[str]:
+    """Pick the union member for an oracle value from its type"""
+    tag = _VALUE_TAGS.get(type(v))
+    if tag is not None:
+        return tag
+    # Subclasses (str/int Enums, Decimal, mappings) fall back to the nearest member
+    for base in (bool, int, str, dict):
+        if isinstance(v, base):
+            return _VALUE_TAGS[base]
+    if isinstance(v, Decimal):
+        return 'float'
+    return None
+
+
+ScalarValue = Annotated[
+    Union[
+        Annotated[bool, Tag('bool')],
+        Annotated[int, Tag('int')],
+        Annotated[float, Tag('float')],
+        Annotated[str, Tag('str')]
+    ],
+    Discriminator(_value_tag)
+]
+
+OracleValue = Annotated[
+    Union[
+        Annotated[bool, Tag('bool')],
+        Annotated[int, Tag('int')],
+        Annotated[float, Tag('float')],
+        Annotated[str, Tag('str')],
+        Annotated[Dict[str, Any], Tag('dict')]
+    ],
+    Discriminator(_value_tag)
+]
+
 # ============ Chainlink Schemas ============
 
 class ChainlinkPriceFeed(BaseModel):
     """Chainlink price feed data structure"""
+    model_config = _RESPONSE_CONFIG
+    
     feed_id: str = Field(..., description="Price feed identifier")
     pair: str = Field(..., description="Asset pair (e.g., ETH/USD)")
     decimals: int = Field(..., ge=0, le=18)
-    latest_answer: Decimal = Field(..., description="Latest price")
-    updated_at: datetime
-    round_id: int = Field(..., ge=0)
-    answered_in_round: int = Field(..., ge=0)
+    latest_answer_raw: int = Field(..., description="Latest answer as reported on-chain (scaled by 10**decimals)")
+    updated_at_ms: EpochMs = Field(
+        ...,
+        validation_alias=AliasChoices('updated_at_ms', 'updated_at'),
+        description="Last update (Unix epoch milliseconds)"
+    )
+    round_id: RoundId
+    answered_in_round: RoundId
     
     # Aggregator metadata
     min_answer: Optional[Decimal] = None
@@ -65,20 +167,51 @@ class ChainlinkPriceFeed(BaseModel):
     heartbeat: Optional[int] = Field(None, description="Expected update interval in seconds")
     
     # Data quality metrics
-    num_oracles: Optional[int] = Field(None, ge=1)
-    aggregator_address: Optional[str] = None
-    proxy_address: Optional[str] = None
+    num_oracles: Optional[Count] = None
+    aggregator_address: Optional[Address] = None
+    proxy_address: Optional[Address] = None
+    
+    @model_validator(mode='before')
+    @classmethod
+    def accept_scaled_answer(cls, data: Any) -> Any:
+        """Accept the pre-raw latest_answer input, a price already scaled by decimals"""
+        if isinstance(data, dict) and 'latest_answer_raw' not in data and 'latest_answer' in data:
+            answer, decimals = data['latest_answer'], data.get('decimals')
+            # Anything unscalable is left for field validation to report
+            if isinstance(answer, (int, float, str, Decimal)) and type(decimals) is int:
+                raw = Decimal(answer if isinstance(answer, (Decimal, int)) else str(answer))
+                data = {**data, 'latest_answer_raw': int(raw.scaleb(decimals))}
+        return data
+    
+    @property
+    def latest_answer(self) -> Decimal:
+        """Latest price, scaled from the raw answer on access"""
+        return Decimal(self.latest_answer_raw).scaleb(-self.decimals)
+    
+    @property
+    def updated_at(self) -> datetime:
+        """Last update as a UTC datetime"""
+        return _from_epoch_ms(self.updated_at_ms)
 
 class ChainlinkVRFRequest(BaseModel):
     """Chainlink VRF (Verifiable Random Function) request"""
+    model_config = _MODEL_CONFIG
+    
     request_id: str
     subscription_id: int
     num_words: int = Field(..., ge=1, le=500)
     callback_gas_limit: int = Field(..., ge=100000)
-    confirmation_blocks: int = Field(default=3, ge=1)
+    confirmation_blocks: Count = 3
+    
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> 'ChainlinkVRFRequest':
+        """Build without validation; only for arguments assembled by SDK code"""
+        return cls.model_construct(**data)
     
 class ChainlinkFunctionsRequest(BaseModel):
     """Chainlink Functions request for custom API calls"""
+    model_config = _MODEL_CONFIG
+    
     source_code: str = Field(..., description="JavaScript source code")
     secrets: Optional[Dict[str, str]] = Field(None, description="Encrypted secrets")
     args: List[str] = Field(default_factory=list)
@@ -87,51 +220,89 @@ class ChainlinkFunctionsRequest(BaseModel):
 
 class ChainlinkAPIResponse(BaseModel):
     """Chainlink Any API response structure"""
+    model_config = _RESPONSE_CONFIG
+    
     job_id: str
     request_id: str
-    result: Union[str, int, float, Dict[str, Any]]
+    result: OracleValue
     fulfilled: bool
     error: Optional[str] = None
     
 # ============ Pyth Network Schemas ============
 
+class PythPriceComponent(BaseModel):
+    """Single publisher's contribution to a Pyth aggregate price"""
+    model_config = _RESPONSE_CONFIG
+    
+    publisher: str
+    price: int = Field(..., description="Price mantissa (scaled by 10**expo)")
+    conf: int = Field(..., description="Confidence mantissa (scaled by 10**expo)")
+    slot: Optional[int] = None
+
 class PythPriceFeed(BaseModel):
     """Pyth Network price feed structure"""
-    feed_id: str = Field(..., description="Pyth price feed ID (hex)")
+    model_config = _RESPONSE_CONFIG
+    
+    feed_id: Bytes32Hex = Field(..., description="Pyth price feed ID (hex)")
     symbol: str = Field(..., description="Asset symbol")
-    price: Decimal = Field(..., description="Current price")
-    confidence: Decimal = Field(..., description="Confidence interval")
+    price: int = Field(..., description="Current price mantissa (scaled by 10**expo)")
+    confidence: int = Field(..., description="Confidence interval mantissa (scaled by 10**expo)")
     expo: int = Field(..., description="Price exponent")
-    publish_time: datetime
+    publish_time_ms: EpochMs = Field(
+        ...,
+        validation_alias=AliasChoices('publish_time_ms', 'publish_time'),
+        description="Publish time (Unix epoch milliseconds)"
+    )
     
     # EMA (Exponential Moving Average) data
-    ema_price: Optional[Decimal] = None
-    ema_confidence: Optional[Decimal] = None
+    ema_price: Optional[int] = None
+    ema_confidence: Optional[int] = None
     
     # Publisher data
-    num_publishers: int = Field(..., ge=1)
+    num_publishers: Count
     max_num_publishers: int
     
     # Price components
-    price_components: Optional[List[Dict[str, Any]]] = None
+    price_components: Optional[List[PythPriceComponent]] = None
+    
+    @property
+    def adjusted_price(self) -> Decimal:
+        """Price adjusted for the exponent"""
+        return Decimal(self.price).scaleb(self.expo)
+    
+    @property
+    def adjusted_confidence(self) -> Decimal:
+        """Confidence interval adjusted for the exponent"""
+        return Decimal(self.confidence).scaleb(self.expo)
     
-    @validator('price', 'confidence')
-    def adjust_for_exponent(cls, v, values):
-        """Adjust price and confidence based on exponent"""
-        if 'expo' in values:
-            return v * Decimal(10) ** values['expo']
-        return v
+    @property
+    def publish_time(self) -> datetime:
+        """Publish time as a UTC datetime"""
+        return _from_epoch_ms(self.publish_time_ms)
 
 class PythUpdateData(BaseModel):
     """Pyth pull-based update data"""
+    model_config = _RESPONSE_CONFIG
+    
     update_data: List[str] = Field(..., description="Hex-encoded update data")
     update_fee: int = Field(..., description="Fee in wei for update")
-    valid_time: datetime
+    valid_time_ms: EpochMs = Field(
+        ...,
+        validation_alias=AliasChoices('valid_time_ms', 'valid_time'),
+        description="Valid-until time (Unix epoch milliseconds)"
+    )
+    
+    @property
+    def valid_time(self) -> datetime:
+        """Valid-until time as a UTC datetime"""
+        return _from_epoch_ms(self.valid_time_ms)
     
 # ============ Band Protocol Schemas ============
 
 class BandReferenceData(BaseModel):
     """Band Protocol reference data structure"""
+    model_config = _RESPONSE_CONFIG
+    
     symbol: str
     rate: Decimal
     resolve_time: datetime
@@ -143,17 +314,26 @@ class BandReferenceData(BaseModel):
     
 class BandStandardDataset(BaseModel):
     """Band Protocol standard dataset query"""
-    symbols: List[str] = Field(..., min_items=1)
-    minimum_sources: int = Field(default=3, ge=1)
-    ask_count: int = Field(default=1, ge=1)
-    min_count: int = Field(default=1, ge=1)
+    model_config = _MODEL_CONFIG
+    
+    symbols: List[str] = Field(..., min_length=1)
+    minimum_sources: Count = 3
+    ask_count: Count = 1
+    min_count: Count = 1
+    
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> 'BandStandardDataset':
+        """Build without validation; only for arguments assembled by SDK code"""
+        return cls.model_construct(**data)
 
 class BandCustomRequest(BaseModel):
     """Band Protocol custom oracle request"""
+    model_config = _MODEL_CONFIG
+    
     oracle_script_id: int
-    calldata: str = Field(..., description="Hex-encoded calldata")
-    ask_count: int = Field(default=4, ge=1)
-    min_count: int = Field(default=3, ge=1)
+    calldata: HexData = Field(..., description="Hex-encoded calldata")
+    ask_count: Count = 4
+    min_count: Count = 3
     client_id: str
     fee_limit: Optional[int] = None
 
@@ -161,6 +341,8 @@ class BandCustomRequest(BaseModel):
 
 class UMAOptimisticOracleRequest(BaseModel):
     """UMA Optimistic Oracle request structure"""
+    model_config = _MODEL_CONFIG
+    
     identifier: str = Field(..., description="Price identifier")
     timestamp: datetime
     ancillary_data: Optional[str] = Field(None, description="Additional data for request")
@@ -171,16 +353,20 @@ class UMAOptimisticOracleRequest(BaseModel):
     
 class UMAProposal(BaseModel):
     """UMA Oracle proposal"""
+    model_config = _MODEL_CONFIG
+    
     request_id: str
-    proposer: str = Field(..., description="Proposer address")
+    proposer: Address = Field(..., description="Proposer address")
     proposed_price: Decimal
     expiration_time: datetime
     disputed: bool = Field(default=False)
     
 class UMADispute(BaseModel):
     """UMA Oracle dispute"""
+    model_config = _MODEL_CONFIG
+    
     request_id: str
-    disputer: str = Field(..., description="Disputer address")
+    disputer: Address = Field(..., description="Disputer address")
     dispute_time: datetime
     dispute_bond: Decimal
     
@@ -188,17 +374,21 @@ class UMADispute(BaseModel):
 
 class API3dAPI(BaseModel):
     """API3 decentralized API (dAPI) structure"""
+    model_config = _MODEL_CONFIG
+    
     dapi_name: str = Field(..., description="dAPI identifier")
-    beacon_id: str = Field(..., description="Beacon ID (hex)")
+    beacon_id: Bytes32Hex = Field(..., description="Beacon ID (hex)")
     value: Union[int, float, str]
     timestamp: datetime
     
     # Data provider information
     provider_name: Optional[str] = None
-    provider_address: Optional[str] = None
+    provider_address: Optional[Address] = None
     
 class API3OIS(BaseModel):
     """API3 Oracle Integration Specification"""
+    model_config = _MODEL_CONFIG
+    
     ois_format: str = Field(default="2.1.0")
     title: str
     version: str
@@ -207,26 +397,37 @@ class API3OIS(BaseModel):
     
 class API3AirnodeRequest(BaseModel):
     """API3 Airnode request structure"""
-    airnode_address: str
+    model_config = _MODEL_CONFIG
+    
+    airnode_address: Address
     endpoint_id: str
-    sponsor_address: str
-    sponsor_wallet_address: str
+    sponsor_address: Address
+    sponsor_wallet_address: Address
     parameters: Dict[str, Any]
     
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> 'API3AirnodeRequest':
+        """Build without validation; only for arguments assembled by SDK code"""
+        return cls.model_construct(**data)
+    
 # ============ Oracle Routing Request/Response ============
 
 class OracleCapability(BaseModel):
     """Describes what an oracle can provide"""
+    model_config = _MODEL_CONFIG
+    
     provider: OracleProvider
     data_categories: List[DataCategory]
     supported_chains: List[str]
     update_frequency: UpdateFrequency
     latency_ms: int = Field(..., description="Average latency in milliseconds")
     cost_estimate_usd: Optional[Decimal] = None
-    reliability_score: float = Field(..., ge=0, le=1)
+    reliability_score: Confidence
     
 class OracleRoutingRequest(BaseModel):
     """Request to route a poll question to appropriate oracle"""
+    model_config = _MODEL_CONFIG
+    
     question: str = Field(..., description="Poll question to analyze")
     category_hint: Optional[DataCategory] = None
     required_chains: Optional[List[str]] = None
@@ -236,12 +437,16 @@ class OracleRoutingRequest(BaseModel):
 
 class AIEnhancementRequest(BaseModel):
     """Request for AI enhancement of oracle routing"""
+    model_config = _MODEL_CONFIG
+    
     question: str
     current_oracle: Optional[OracleProvider] = None
-    current_confidence: float = Field(..., ge=0, le=1)
+    current_confidence: Confidence
     
 class AIEnhancementResponse(BaseModel):
     """Response from AI enhancement"""
+    model_config = _RESPONSE_CONFIG
+    
     oracle: OracleProvider
     data_type: DataCategory
     feeds: List[str] = Field(default_factory=list)
@@ -250,6 +455,8 @@ class AIEnhancementResponse(BaseModel):
     
 class OracleRoutingResponse(BaseModel):
     """Response from oracle routing engine"""
+    model_config = _RESPONSE_CONFIG
+    
     can_resolve: bool = Field(..., description="Whether any oracle can resolve this")
     selected_oracle: Optional[OracleProvider] = None
     reasoning: str = Field(..., description="Explanation of routing decision")
@@ -267,32 +474,36 @@ class OracleRoutingResponse(BaseModel):
     # Cost and performance estimates
     estimated_cost_usd: Optional[Decimal] = None
     estimated_latency_ms: Optional[int] = None
-    confidence_score: float = Field(..., ge=0, le=1)
+    confidence_score: Confidence
     
     # Resolution parameters
     resolution_method: Optional[Literal["direct", "aggregated", "optimistic"]] = None
     update_frequency: Optional[UpdateFrequency] = None
     
-    @validator('selected_oracle')
-    def validate_selection(cls, v, values):
+    @model_validator(mode='after')
+    def validate_selection(self) -> 'OracleRoutingResponse':
         """Ensure oracle is selected only if resolvable"""
-        if values.get('can_resolve') and not v:
+        if self.can_resolve and not self.selected_oracle:
             raise ValueError("Oracle must be selected if question is resolvable")
-        return v
+        return self
 
 # ============ Oracle Data Response Models ============
 
 class OracleDataPoint(BaseModel):
     """Generic oracle data point"""
+    model_config = _RESPONSE_CONFIG
+    
     provider: OracleProvider
     data_type: DataCategory
-    value: Union[str, int, float, bool, Dict[str, Any]]
+    value: OracleValue
     timestamp: datetime
-    confidence: Optional[float] = Field(None, ge=0, le=1)
-    metadata: Optional[Dict[str, Any]] = None
+    confidence: Optional[Confidence] = None
+    metadata: Optional[Dict[str, Optional[ScalarValue]]] = None
     
 class OraclePollData(BaseModel):
     """Oracle data for creating/resolving a poll"""
+    model_config = _RESPONSE_CONFIG
+    
     poll_id: str
     oracle_provider: OracleProvider
     data_points: List[OracleDataPoint]
@@ -306,29 +517,171 @@ class OraclePollData(BaseModel):
     
 class OracleHealthCheck(BaseModel):
     """Oracle provider health status"""
+    model_config = _RESPONSE_CONFIG
+    
     provider: OracleProvider
     is_healthy: bool
     last_update: datetime
     active_feeds: int
-    error_rate: float = Field(..., ge=0, le=1)
+    error_rate: Probability
     average_latency_ms: int
     status_message: str
 
 # ============ Aggregated Oracle Data ============
 
+# Relative spread (max - min) / max above which provider values disagree
+_DISCREPANCY_THRESHOLD = 0.05
+
+
+def _spread_exceeds(lo: float, hi: float) -> bool:
+    """Whether a min/max pair spreads more than the discrepancy threshold"""
+    return hi > 0 and (hi - lo) / hi > _DISCREPANCY_THRESHOLD
+
+
+def _has_discrepancy(values: Iterable[Any]) -> bool:
+    """Whether the numeric values spread more than the discrepancy threshold"""
+    numeric = [v for v in values if type(v) is int or type(v) is float]
+    if len(numeric) < 2:
+        return False
+    return _spread_exceeds(min(numeric), max(numeric))
+
+
+def _median(values: Sequence[float]) -> float:
+    if len(values) == 2:
+        # Common Chainlink + Pyth pair: the median is the mean, no sort needed
+        return (values[0] + values[1]) / 2
+    return statistics.median(values)
+
+
+def _mean(values: Sequence[float]) -> float:
+    return math.fsum(values) / len(values)
+
+
+def _weighted(values: Sequence[float], weights: Optional[Sequence[float]]) -> float:
+    if not weights:
+        return _mean(values)
+    if len(weights) != len(values):
+        raise ValueError("weights must match values one-to-one")
+    return math.fsum(v * w for v, w in zip(values, weights)) / math.fsum(weights)
+
+
+def _unanimous(values: Sequence[float]) -> float:
+    return values[0]
+
+
+# Unweighted kernels; "weighted" is dispatched separately with its weights
+_AGGREGATORS = {
+    "median": _median,
+    "mean": _mean,
+    "unanimous": _unanimous
+}
+
+
+def aggregate_values(
+    values: Sequence[float],
+    method: str = "median",
+    weights: Optional[Sequence[float]] = None
+) -> Tuple[float, bool]:
+    """
+    Aggregate numeric provider values and flag disagreement in one pass
+    
+    Args:
+        values: Non-empty numeric values, one per provider
+        method: One of "median", "mean", "weighted", "unanimous"
+        weights: Per-value weights for the "weighted" method
+        
+    Returns:
+        Tuple[float, bool]: Aggregated value and whether a discrepancy was
+        detected (any disagreement for "unanimous", a >5% spread otherwise)
+        
+    Raises:
+        ValueError: If values is empty or method is unknown
+    """
+    if not values:
+        raise ValueError("aggregate_values needs at least one value")
+    if method == "weighted":
+        aggregated = _weighted(values, weights)
+    elif method in _AGGREGATORS:
+        aggregated = _AGGREGATORS[method](values)
+    else:
+        raise ValueError(f"Unknown aggregation method: {method}")
+    lo, hi = min(values), max(values)
+    if method == "unanimous":
+        return aggregated, lo != hi
+    return aggregated, _spread_exceeds(lo, hi)
+
+
 class AggregatedOracleData(BaseModel):
     """Aggregated data from multiple oracles"""
+    model_config = _RESPONSE_CONFIG
+    
     data_type: DataCategory
     providers: List[OracleProvider]
-    aggregation_method: Literal["median", "mean", "weighted", "unanimous"]
-    aggregated_value: Union[str, int, float, bool]
-    individual_values: Dict[str, Any] = Field(..., description="Provider -> value mapping")
+    # "latest" takes the most recent value, for non-numeric data
+    aggregation_method: Literal["median", "mean", "weighted", "unanimous", "latest"]
+    aggregated_value: OracleValue
+    individual_values: Dict[str, OracleValue] = Field(..., description="Provider -> value mapping")
     timestamp: datetime
-    confidence: float = Field(..., ge=0, le=1)
+    confidence: Confidence
     discrepancy_detected: bool = Field(default=False)
     
-    @root_validator
-    def check_discrepancy(cls, values):
-        """Check for significant discrepancies between oracle values"""
-        # Implementation would check variance between individual values
-        return values
\ No newline at end of file
+    @model_validator(mode='before')
+    @classmethod
+    def check_discrepancy(cls, data: Any) -> Any:
+        """Flag a >5% spread between numeric provider values"""
+        if isinstance(data, dict) and not data.get('discrepancy_detected'):
+            values = data.get('individual_values')
+            # Single-provider fallbacks can't disagree; skip the scan
+            if values and len(values) >= 2 and _has_discrepancy(values.values()):
+                data = {**data, 'discrepancy_detected': True}
+        return data
+
+# ============ Batch Parsing ============
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    """List adapter for a model, built on first use so import stays cheap"""
+    return TypeAdapter(List[model])
+
+def parse_datapoints(raw: Union[str, bytes]) -> List[OracleDataPoint]:
+    """Validate a JSON array of data points straight from the raw payload"""
+    return _list_adapter(OracleDataPoint).validate_json(raw)
+
+def parse_datapoint_dicts(batch: List[Dict[str, Any]]) -> List[OracleDataPoint]:
+    """Validate a batch of data point dicts in one pydantic-core call"""
+    return _list_adapter(OracleDataPoint).validate_python(batch)
+
+def parse_chainlink_feeds(raw: Union[str, bytes]) -> List[ChainlinkPriceFeed]:
+    """Validate a JSON array of Chainlink price feeds"""
+    return _list_adapter(ChainlinkPriceFeed).validate_json(raw)
+
+def parse_pyth_feeds(raw: Union[str, bytes]) -> List[PythPriceFeed]:
+    """Validate a JSON array of Pyth price feeds"""
+    return _list_adapter(PythPriceFeed).validate_json(raw)
+
+def parse_health_checks(raw: Union[str, bytes]) -> List[OracleHealthCheck]:
+    """Validate a JSON array of provider health checks"""
+    return _list_adapter(OracleHealthCheck).validate_json(raw)
+
+# ============ Schema Warm-up ============
+
+_ALL_MODELS: Tuple[type[BaseModel], ...] = (
+    ChainlinkPriceFeed, ChainlinkVRFRequest, ChainlinkFunctionsRequest, ChainlinkAPIResponse,
+    PythPriceComponent, PythPriceFeed, PythUpdateData,
+    BandReferenceData, BandStandardDataset, BandCustomRequest,
+    UMAOptimisticOracleRequest, UMAProposal, UMADispute,
+    API3dAPI, API3OIS, API3AirnodeRequest,
+    OracleCapability, OracleRoutingRequest, AIEnhancementRequest, AIEnhancementResponse,
+    OracleRoutingResponse, OracleDataPoint, OraclePollData, OracleHealthCheck,
+    AggregatedOracleData
+)
+
+def build_schemas() -> None:
+    """
+    Build every deferred schema now rather than on first validation
+    
+    Long-running services can call this at startup so the first request
+    doesn't pay for schema construction. Already-built models are skipped.
+    """
+    for model in _ALL_MODELS:
+        model.model_rebuild()
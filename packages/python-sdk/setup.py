@@ -43,7 +43,7 @@ setup(
     python_requires=">=3.9",
     install_requires=requirements or [
         "aiohttp>=3.8.0",
-        "pydantic>=2.0.0",
+        "pydantic>=2.5.0",
         "python-dotenv>=1.0.0",
         "asyncio-mqtt>=0.11.0",  # For real-time updates
         "web3>=6.0.0",  # For blockchain interactions
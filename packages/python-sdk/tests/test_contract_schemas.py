@@ -0,0 +1,42 @@
+"""
+Tests for contract schema models
+"""
+
+from openoracle.schemas.contract_schemas import Poll, _POLL_EXAMPLE
+
+
+def make_poll(**overrides) -> Poll:
+    """Build a validated poll from the schema example"""
+    return Poll(**{**_POLL_EXAMPLE, **overrides})
+
+
+class TestPollParticipants:
+    """Test participant tracking on polls"""
+    
+    def test_count_defaults_to_unique_participants(self):
+        """Omitting participant_count derives it from unique addresses"""
+        data = {key: value for key, value in _POLL_EXAMPLE.items() if key != 'participant_count'}
+        poll = Poll(**{**data, 'participants': ['0xb', '0xa', '0xb']})
+        
+        assert poll.participant_count == 2
+    
+    def test_explicit_count_is_kept(self):
+        """An explicit participant_count is not overwritten"""
+        poll = make_poll(participants=['0xa'], participant_count=5)
+        
+        assert poll.participant_count == 5
+        assert poll.model_dump()['participant_count'] == 5
+    
+    def test_join_order_is_preserved(self):
+        """Participants keep the order they joined in"""
+        poll = make_poll(participants=['0xc', '0xa', '0xb'])
+        
+        assert poll.participants == ['0xc', '0xa', '0xb']
+        assert poll.model_dump()['participants'] == ['0xc', '0xa', '0xb']
+    
+    def test_from_trusted_derives_count(self):
+        """Trusted construction fills in the count the same way"""
+        data = {key: value for key, value in _POLL_EXAMPLE.items() if key != 'participant_count'}
+        poll = Poll.from_trusted({**data, 'participants': ['0xa', '0xb']})
+        
+        assert poll.participant_count == 2
@@ -0,0 +1,202 @@
+"""
+Tests for oracle data schemas
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from pydantic import ValidationError
+
+from openoracle.schemas.oracle_schemas import (
+    ChainlinkPriceFeed,
+    DataCategory,
+    OracleDataPoint,
+    OracleProvider,
+    PythPriceFeed,
+    PythUpdateData,
+    aggregate_values
+)
+
+
+CHAINLINK_FEED = {
+    'feed_id': '0x5f4eC3Df9cbd43714FE2740f5E3616155c5b8419',
+    'pair': 'ETH/USD',
+    'decimals': 8,
+    'updated_at_ms': 1703097600000,
+    'round_id': 12345678,
+    'answered_in_round': 12345678
+}
+
+
+class TestChainlinkPriceFeed:
+    """Test Chainlink price feed compatibility"""
+    
+    def test_raw_answer_is_scaled_on_access(self):
+        """latest_answer rebuilds the price from the raw on-chain answer"""
+        feed = ChainlinkPriceFeed(**CHAINLINK_FEED, latest_answer_raw=345678901234)
+        
+        assert feed.latest_answer == Decimal('3456.78901234')
+    
+    def test_scaled_latest_answer_is_accepted(self):
+        """The pre-raw latest_answer input still validates"""
+        feed = ChainlinkPriceFeed(**CHAINLINK_FEED, latest_answer=Decimal('3456.78901234'))
+        
+        assert feed.latest_answer_raw == 345678901234
+        assert feed.latest_answer == Decimal('3456.78901234')
+    
+    def test_scaled_latest_answer_from_json(self):
+        """JSON payloads with a float latest_answer scale without float error"""
+        feed = ChainlinkPriceFeed.model_validate({**CHAINLINK_FEED, 'latest_answer': 0.1})
+        
+        assert feed.latest_answer_raw == 10000000
+    
+    def test_missing_answer_is_rejected(self):
+        """A feed without any answer fails validation"""
+        with pytest.raises(ValidationError):
+            ChainlinkPriceFeed(**CHAINLINK_FEED)
+
+
+UPDATED_AT = datetime(2023, 12, 20, 18, 40, tzinfo=timezone.utc)
+
+
+class TestEpochTimestamps:
+    """Test epoch-millisecond timestamps and their pre-rename inputs"""
+    
+    def test_chainlink_accepts_updated_at(self):
+        """A datetime updated_at fills updated_at_ms"""
+        data = {key: value for key, value in CHAINLINK_FEED.items() if key != 'updated_at_ms'}
+        feed = ChainlinkPriceFeed(**data, latest_answer_raw=1, updated_at=UPDATED_AT)
+        
+        assert feed.updated_at_ms == 1703097600000
+        assert feed.updated_at == UPDATED_AT
+    
+    def test_pyth_accepts_publish_time(self):
+        """An ISO publish_time fills publish_time_ms"""
+        feed = PythPriceFeed(
+            feed_id='e62df6c8b4a85fe1a67db44dc12de5db330f7ac66b72dc658afedf0f4a415b43',
+            symbol='BTC/USD',
+            price=6500000000000,
+            confidence=6500000000,
+            expo=-8,
+            publish_time='2023-12-20T18:40:00Z',
+            num_publishers=10,
+            max_num_publishers=32
+        )
+        
+        assert feed.publish_time_ms == 1703097600000
+        assert feed.publish_time == UPDATED_AT
+        assert feed.adjusted_price == Decimal('65000.00000000')
+    
+    def test_update_data_valid_time(self):
+        """PythUpdateData stores valid_time as epoch milliseconds"""
+        update = PythUpdateData(update_data=['0x00'], update_fee=1, valid_time=UPDATED_AT)
+        
+        assert update.valid_time_ms == 1703097600000
+        assert update.valid_time == UPDATED_AT
+        assert PythUpdateData(update_data=[], update_fee=1, valid_time_ms=5).valid_time_ms == 5
+    
+    def test_naive_inputs_are_utc(self):
+        """Naive datetimes and ISO strings are read as UTC, not local time"""
+        naive = UPDATED_AT.replace(tzinfo=None)
+        
+        assert PythUpdateData(update_data=[], update_fee=1, valid_time=naive).valid_time_ms == 1703097600000
+        assert PythUpdateData(
+            update_data=[], update_fee=1, valid_time='2023-12-20T18:40:00'
+        ).valid_time_ms == 1703097600000
+    
+    def test_millisecond_precision(self):
+        """Sub-second parts truncate to whole milliseconds and round-trip exactly"""
+        late = UPDATED_AT.replace(microsecond=999999)
+        update = PythUpdateData(update_data=[], update_fee=1, valid_time=late)
+        
+        assert update.valid_time_ms == 1703097600999
+        assert update.valid_time == UPDATED_AT.replace(microsecond=999000)
+
+
+class TestAggregateValues:
+    """Test the shared aggregation kernels"""
+    
+    def test_median(self):
+        """Median of an odd count and of the common two-provider pair"""
+        assert aggregate_values([100.0, 101.0, 250.0], "median") == (101.0, True)
+        assert aggregate_values([100.0, 102.0], "median") == (101.0, False)
+    
+    def test_mean(self):
+        """Mean uses an exact float sum"""
+        assert aggregate_values([0.1, 0.2, 0.3], "mean") == (pytest.approx(0.2), True)
+    
+    def test_weighted(self):
+        """Weighted mean honours weights and falls back to the mean without them"""
+        value, discrepancy = aggregate_values([100.0, 104.0], "weighted", weights=[3, 1])
+        
+        assert value == 101.0
+        assert not discrepancy
+        assert aggregate_values([100.0, 104.0], "weighted")[0] == 102.0
+    
+    def test_weighted_rejects_mismatched_weights(self):
+        """Weights must pair up with values"""
+        with pytest.raises(ValueError):
+            aggregate_values([100.0, 104.0], "weighted", weights=[1])
+    
+    def test_unanimous(self):
+        """Unanimous flags any disagreement, however small"""
+        assert aggregate_values([5.0, 5.0], "unanimous") == (5.0, False)
+        assert aggregate_values([5.0, 5.01], "unanimous") == (5.0, True)
+    
+    @pytest.mark.parametrize("method", ["median", "mean", "weighted", "unanimous"])
+    def test_single_value(self, method):
+        """A single value aggregates to itself with no discrepancy"""
+        assert aggregate_values([42.0], method) == (42.0, False)
+    
+    @pytest.mark.parametrize("method", ["median", "mean", "weighted", "unanimous"])
+    def test_empty_values_raise(self, method):
+        """There is nothing to aggregate without values"""
+        with pytest.raises(ValueError):
+            aggregate_values([], method)
+    
+    def test_unknown_method_raises(self):
+        """Methods outside the schema's Literal are rejected"""
+        with pytest.raises(ValueError):
+            aggregate_values([1.0], "mode")
+
+
+def data_point(value) -> OracleDataPoint:
+    """Validate a data point carrying the given value"""
+    return OracleDataPoint(
+        provider=OracleProvider.CHAINLINK,
+        data_type=DataCategory.PRICE,
+        value=value,
+        timestamp=UPDATED_AT
+    )
+
+
+class TestOracleValue:
+    """Test the type-dispatched oracle value union"""
+    
+    @pytest.mark.parametrize("value", [True, 7, 7.5, "7", {"home": 3, "away": 1}])
+    def test_value_keeps_its_type(self, value):
+        """Each value validates against its own member, with no cross-coercion"""
+        point = data_point(value)
+        
+        assert point.value == value
+        assert type(point.value) is type(value)
+    
+    def test_subclasses_use_nearest_member(self):
+        """Enum and Decimal values fall back to str and float members"""
+        assert data_point(DataCategory.PRICE).value == "price"
+        assert data_point(Decimal("1.25")).value == 1.25
+    
+    def test_json_values_dispatch_by_type(self):
+        """JSON payloads dispatch the same way"""
+        point = OracleDataPoint.model_validate_json(
+            '{"provider": "pyth", "data_type": "price", "value": false,'
+            ' "timestamp": "2023-12-20T18:40:00Z"}'
+        )
+        
+        assert point.value is False
+    
+    def test_unsupported_value_is_rejected(self):
+        """Values matching no member fail validation"""
+        with pytest.raises(ValidationError):
+            data_point([1, 2])
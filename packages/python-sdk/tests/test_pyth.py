@@ -0,0 +1,122 @@
+"""
+Tests for the Pyth Network provider
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from openoracle.providers.pyth import PythProvider
+
+
+def hermes_entry(feed_id: str, price: str, publish_time: int = 1703097600) -> dict:
+    """Build a Hermes latest_price_feeds entry, id unprefixed as Hermes sends it"""
+    return {
+        'id': feed_id.removeprefix('0x'),
+        'price': {'price': price, 'conf': '1000000', 'expo': -8, 'publish_time': publish_time},
+        'ema_price': {'price': price, 'conf': '1000000', 'expo': -8, 'publish_time': publish_time}
+    }
+
+
+@pytest.fixture
+def provider():
+    """Pyth provider with a one-second price cache"""
+    return PythProvider(cache_ttl_s=1.0)
+
+
+class TestPriceFeedsBatch:
+    """Test fetching several Pyth feeds in one Hermes request"""
+    
+    @pytest.mark.asyncio
+    async def test_partial_misses(self, provider):
+        """Returned feeds are parsed, missing ones mocked and unknown ones skipped"""
+        btc_id = PythProvider.PRICE_FEED_IDS['BTC/USD']
+        hermes = AsyncMock(return_value=[hermes_entry(btc_id, '6500000000000')])
+        
+        with patch.object(provider, '_hermes_get', hermes):
+            feeds = await provider.get_price_feeds_batch(['BTC/USD', 'ETH/USD', 'NOPE/USD'])
+        
+        hermes.assert_awaited_once()
+        params = hermes.await_args.kwargs['params']
+        assert params == [
+            ('ids[]', btc_id),
+            ('ids[]', PythProvider.PRICE_FEED_IDS['ETH/USD'])
+        ]
+        
+        assert set(feeds) == {'BTC/USD', 'ETH/USD'}
+        assert feeds['BTC/USD'].feed_id == btc_id
+        assert feeds['BTC/USD'].price == 6500000000000
+        assert feeds['BTC/USD'].publish_time_ms == 1703097600000
+        # ETH was not in the Hermes reply, so it falls back to mock data
+        assert feeds['ETH/USD'].num_publishers == 20
+        assert 'ETH/USD' not in provider._cache
+    
+    @pytest.mark.asyncio
+    async def test_hermes_failure_falls_back_to_mocks(self, provider):
+        """A failed request still answers every known symbol"""
+        with patch.object(provider, '_hermes_get', AsyncMock(side_effect=RuntimeError("down"))):
+            feeds = await provider.get_price_feeds_batch(['BTC/USD', 'SOL/USD'])
+        
+        assert set(feeds) == {'BTC/USD', 'SOL/USD'}
+        assert provider._cache == {}
+
+
+class TestPriceCache:
+    """Test the per-symbol TTL cache"""
+    
+    @pytest.mark.asyncio
+    async def test_fresh_entries_skip_hermes(self, provider):
+        """Feeds fetched within the TTL are served from the cache"""
+        btc_id = PythProvider.PRICE_FEED_IDS['BTC/USD']
+        hermes = AsyncMock(return_value=[hermes_entry(btc_id, '6500000000000')])
+        
+        with patch.object(provider, '_hermes_get', hermes):
+            first = await provider.get_price_feeds_batch(['BTC/USD'])
+            second = await provider.get_price_feeds_batch(['BTC/USD'])
+            single = await provider.get_price_feed('BTC/USD')
+        
+        hermes.assert_awaited_once()
+        assert second['BTC/USD'] is first['BTC/USD']
+        assert single is first['BTC/USD']
+    
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_refetched(self, provider):
+        """Feeds older than the TTL are fetched again"""
+        btc_id = PythProvider.PRICE_FEED_IDS['BTC/USD']
+        hermes = AsyncMock(side_effect=[
+            [hermes_entry(btc_id, '6500000000000')],
+            [hermes_entry(btc_id, '6600000000000')]
+        ])
+        
+        with patch.object(provider, '_hermes_get', hermes):
+            await provider.get_price_feeds_batch(['BTC/USD'])
+            # Age the entry past the one-second TTL
+            fetched_at, feed = provider._cache['BTC/USD']
+            provider._cache['BTC/USD'] = (fetched_at - 1.5, feed)
+            feeds = await provider.get_price_feeds_batch(['BTC/USD'])
+        
+        assert hermes.await_count == 2
+        assert feeds['BTC/USD'].price == 6600000000000
+
+
+class TestSessionLifecycle:
+    """Test that the lazily opened Hermes session is released"""
+    
+    @pytest.mark.asyncio
+    async def test_close_releases_session(self, provider):
+        """close() closes the session opened by start()"""
+        await provider.start()
+        session = provider._session
+        
+        await provider.close()
+        
+        assert session.closed
+        assert provider._session is None
+    
+    @pytest.mark.asyncio
+    async def test_context_manager_releases_session(self):
+        """Leaving the async with block closes the session"""
+        async with PythProvider() as provider:
+            session = provider._session
+            assert not session.closed
+        
+        assert session.closed
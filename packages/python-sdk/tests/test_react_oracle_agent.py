@@ -0,0 +1,250 @@
+"""
+Tests for the ReAct oracle agent's OpenRouter calls
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from cachetools import TTLCache
+from unittest.mock import AsyncMock, patch
+
+from openoracle.core.exceptions import AIServiceError
+from openoracle.react_oracle_agent import CombinedAnalysis, ReactOracleAgent
+from openoracle.schemas.oracle_schemas import OracleProvider, OracleRoutingRequest
+
+
+ANALYSIS = {
+    "context": {
+        "question_type": "price",
+        "data_requirements": {"asset": "BTC"},
+        "timing_constraints": None,
+        "accuracy_requirements": "high",
+        "cost_sensitivity": "low",
+        "chain_preferences": ["ethereum"]
+    },
+    "reasoning": {
+        "question": "q",
+        "thoughts": [
+            {"step_number": 1, "thought": "t", "observation": "o", "action": "a", "result": "r"}
+        ],
+        "final_decision": "pyth",
+        "selected_oracle": "pyth",
+        "confidence": 0.9,
+        "alternative_considered": ["chainlink"]
+    }
+}
+
+
+def completion(content: dict) -> httpx.Response:
+    """Build a non-streamed chat completion response"""
+    return httpx.Response(200, json={
+        "model": "openai/gpt-4o-mini",
+        "choices": [{"message": {"role": "assistant", "content": json.dumps(content)}}]
+    })
+
+
+async def make_agent(handler) -> ReactOracleAgent:
+    """Create an agent whose client is served by a mock transport"""
+    agent = ReactOracleAgent("test-key")
+    await agent.start()
+    agent._client._transport = httpx.MockTransport(handler)
+    return agent
+
+
+class TestChatCompletion:
+    """Test sending and decoding chat completions"""
+    
+    @pytest.mark.asyncio
+    async def test_decodes_message_content(self):
+        """One non-streamed POST is sent and its JSON content decoded"""
+        bodies = []
+        
+        def handler(request):
+            bodies.append(json.loads(request.content))
+            return completion({"answer": 42})
+        
+        agent = await make_agent(handler)
+        data = await agent._chat_completion({"model": "m", "messages": []})
+        await agent.close()
+        
+        assert data == {"answer": 42}
+        assert len(bodies) == 1
+        assert "stream" not in bodies[0]
+    
+    @pytest.mark.asyncio
+    async def test_error_payload_raises(self):
+        """An error object in a 200 response raises instead of decoding"""
+        def handler(request):
+            return httpx.Response(200, json={"error": {"code": 502, "message": "upstream down"}})
+        
+        agent = await make_agent(handler)
+        with pytest.raises(AIServiceError) as exc_info:
+            await agent._chat_completion({"model": "m", "messages": []})
+        await agent.close()
+        
+        assert exc_info.value.service_error == "upstream down"
+    
+    @pytest.mark.asyncio
+    async def test_non_200_returns_none(self):
+        """A permanent HTTP error yields None without retrying"""
+        calls = []
+        
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(400)
+        
+        agent = await make_agent(handler)
+        assert await agent._chat_completion({"model": "m", "messages": []}) is None
+        await agent.close()
+        
+        assert len(calls) == 1
+    
+    @pytest.mark.asyncio
+    async def test_transient_error_is_retried(self):
+        """A 503 is retried and the next successful attempt is decoded"""
+        responses = [httpx.Response(503), completion({"ok": True})]
+        
+        agent = await make_agent(lambda request: responses.pop(0))
+        data = await agent._chat_completion({"model": "m", "messages": []})
+        await agent.close()
+        
+        assert data == {"ok": True}
+        assert responses == []
+    
+    @pytest.mark.asyncio
+    async def test_exhausted_retries_raise_original_error(self):
+        """After the last attempt the HTTP error surfaces, not a RetryError"""
+        calls = []
+        
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503)
+        
+        agent = await make_agent(handler)
+        with pytest.raises(httpx.HTTPStatusError):
+            await agent._chat_completion({"model": "m", "messages": []})
+        await agent.close()
+        
+        assert len(calls) == 3
+
+
+async def fake_analysis(prompt: str, max_tokens: int) -> dict:
+    """Answer a single or batched analysis prompt, sized by its token budget"""
+    await asyncio.sleep(0.01)
+    if "Questions:" in prompt:
+        return {"results": [ANALYSIS] * (max_tokens // 2000)}
+    return ANALYSIS
+
+
+def question(i: int) -> OracleRoutingRequest:
+    """Build a distinct routing request"""
+    return OracleRoutingRequest(question=f"Will asset {i} reach its target?")
+
+
+class TestAnalysisBatching:
+    """Test coalescing concurrent analyses into shared requests"""
+    
+    @pytest.mark.asyncio
+    async def test_idle_queue_flushes_immediately(self):
+        """A lone question is sent without waiting for the batch window"""
+        agent = ReactOracleAgent("test-key")
+        agent.BATCH_WINDOW_MS = 10_000
+        
+        with patch.object(agent, '_request_analysis', side_effect=fake_analysis) as mock_request:
+            result = await asyncio.wait_for(agent._enqueue_analysis(question(0)), timeout=1)
+        
+        assert isinstance(result, CombinedAnalysis)
+        mock_request.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_questions_share_requests(self):
+        """Ten concurrent questions go out as one, then eight, then one"""
+        agent = ReactOracleAgent("test-key")
+        
+        with patch.object(agent, '_request_analysis', side_effect=fake_analysis) as mock_request:
+            results = await asyncio.gather(*(agent._enqueue_analysis(question(i)) for i in range(10)))
+        
+        assert all(isinstance(result, CombinedAnalysis) for result in results)
+        budgets = [call.kwargs['max_tokens'] for call in mock_request.await_args_list]
+        assert budgets == [2000, 2000 * agent.MAX_BATCH_SIZE, 2000]
+    
+    @pytest.mark.asyncio
+    async def test_malformed_entry_only_fails_its_question(self):
+        """A bad entry in a batched reply doesn't discard its neighbours"""
+        agent = ReactOracleAgent("test-key")
+        reply = {"results": [ANALYSIS, {"context": {}}, ANALYSIS]}
+        
+        with patch.object(agent, '_request_analysis', AsyncMock(return_value=reply)):
+            results = await agent._analyze_and_reason_batch([question(i) for i in range(3)])
+        
+        assert results[1] is None
+        assert results[0].reasoning.selected_oracle == OracleProvider.PYTH
+        assert results[2].reasoning.selected_oracle == OracleProvider.PYTH
+    
+    @pytest.mark.asyncio
+    async def test_result_count_mismatch_fails_whole_batch(self):
+        """Results can't be matched to questions when the counts differ"""
+        agent = ReactOracleAgent("test-key")
+        reply = {"results": [ANALYSIS, ANALYSIS]}
+        
+        with patch.object(agent, '_request_analysis', AsyncMock(return_value=reply)):
+            results = await agent._analyze_and_reason_batch([question(i) for i in range(3)])
+        
+        assert results == [None, None, None]
+
+
+class TestRouteCache:
+    """Test caching routing decisions per normalized question"""
+    
+    def make_agent(self, now):
+        """Agent whose route cache reads time from a settable clock"""
+        agent = ReactOracleAgent("test-key")
+        agent._route_cache = TTLCache(maxsize=8, ttl=60, timer=lambda: now[0])
+        return agent
+    
+    @pytest.mark.asyncio
+    async def test_cache_hit_returns_independent_copies(self):
+        """A repeated question skips the LLM and can't mutate the cached route"""
+        now = [0.0]
+        agent = self.make_agent(now)
+        
+        with patch.object(agent, '_request_analysis', side_effect=fake_analysis) as mock_request:
+            first, first_chain = await agent.think_and_route(question(0))
+            first.oracle_config['mutated'] = True
+            first_chain.thoughts.clear()
+            second, second_chain = await agent.think_and_route(question(0))
+        
+        mock_request.assert_awaited_once()
+        assert second.selected_oracle == OracleProvider.PYTH
+        assert 'mutated' not in second.oracle_config
+        assert len(second_chain.thoughts) == 1
+    
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_recomputed(self):
+        """Once the TTL elapses the question is analyzed again"""
+        now = [0.0]
+        agent = self.make_agent(now)
+        
+        with patch.object(agent, '_request_analysis', side_effect=fake_analysis) as mock_request:
+            await agent.think_and_route(question(0))
+            now[0] = 61.0
+            await agent.think_and_route(question(0))
+        
+        assert mock_request.await_count == 2
+
+
+class TestOracleConfig:
+    """Test per-oracle configuration built into routing responses"""
+    
+    def test_configs_share_no_mutable_state(self):
+        """Mutating one route's config leaves later routes untouched"""
+        agent = ReactOracleAgent("test-key")
+        first = agent._build_oracle_config(OracleProvider.UMA, "q")
+        first["bond_amount"] = "0"
+        
+        second = agent._build_oracle_config(OracleProvider.UMA, "q")
+        
+        assert second["bond_amount"] == "100"
+        assert isinstance(second["resolution_sources"], tuple)
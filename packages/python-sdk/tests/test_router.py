@@ -0,0 +1,203 @@
+"""
+Tests for OpenOracleRouter data retrieval
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from unittest.mock import patch
+
+from openoracle.core.router import OpenOracleRouter
+from openoracle.providers.pyth import PythProvider
+from openoracle.schemas.oracle_schemas import (
+    AggregatedOracleData,
+    DataCategory,
+    OracleDataPoint,
+    OracleProvider
+)
+
+
+class FakePriceProvider:
+    """Price provider that records the asset it was asked for"""
+    
+    def __init__(self, provider: OracleProvider, delay: float):
+        self.provider = provider
+        self.delay = delay
+        self.requested = []
+        self.cancelled = False
+    
+    async def get_price_feed(self, asset: str):
+        self.requested.append(asset)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return asset
+    
+    async def to_oracle_data_point(self, asset: str) -> OracleDataPoint:
+        return OracleDataPoint.model_construct(
+            provider=self.provider,
+            data_type=DataCategory.PRICE,
+            value=100.0,
+            timestamp=datetime.now(timezone.utc),
+            metadata={'asset': asset}
+        )
+
+
+@pytest.fixture
+def router():
+    """Router with fake Chainlink (slow) and Pyth (fast) providers"""
+    with patch('openoracle.core.router.OracleRoutingEngine', create=True):
+        router = OpenOracleRouter(enable_ai_routing=False)
+    router.providers = {
+        OracleProvider.CHAINLINK: FakePriceProvider(OracleProvider.CHAINLINK, 0.5),
+        OracleProvider.PYTH: FakePriceProvider(OracleProvider.PYTH, 0.01),
+    }
+    return router
+
+
+class TestFastestOracleData:
+    """Test racing providers for the first data point"""
+    
+    @pytest.mark.asyncio
+    async def test_mixed_provider_race_uses_same_asset(self, router):
+        """Chainlink-style config is resolved to the same asset for Pyth"""
+        result = await router.get_oracle_data_fastest(
+            DataCategory.PRICE,
+            {'pair': 'SOL/USD'},
+            [OracleProvider.CHAINLINK, OracleProvider.PYTH]
+        )
+        
+        assert result.provider == OracleProvider.PYTH
+        assert result.metadata['asset'] == 'SOL/USD'
+        assert router.providers[OracleProvider.CHAINLINK].requested == ['SOL/USD']
+        assert router.providers[OracleProvider.PYTH].requested == ['SOL/USD']
+    
+    @pytest.mark.asyncio
+    async def test_losers_are_cancelled_and_awaited(self, router):
+        """The slower provider is cancelled before the race returns"""
+        await router.get_oracle_data_fastest(
+            DataCategory.PRICE,
+            {'symbol': 'ETH/USD'},
+            [OracleProvider.CHAINLINK, OracleProvider.PYTH]
+        )
+        
+        assert router.providers[OracleProvider.CHAINLINK].cancelled
+    
+    @pytest.mark.asyncio
+    async def test_no_asset_queries_only_first_provider(self, router):
+        """Without a named asset, providers aren't raced on their own defaults"""
+        result = await router.get_oracle_data_fastest(
+            DataCategory.PRICE,
+            {},
+            [OracleProvider.CHAINLINK, OracleProvider.PYTH]
+        )
+        
+        assert result.provider == OracleProvider.CHAINLINK
+        assert router.providers[OracleProvider.PYTH].requested == []
+
+
+class FakeDataProvider:
+    """Provider returning a fixed value for price and sports requests"""
+    
+    def __init__(self, provider: OracleProvider, value):
+        self.provider = provider
+        self.value = value
+    
+    async def get_price_feed(self, asset: str):
+        return asset
+    
+    async def get_sports_data(self, sport: str, game_id: str):
+        return self.value
+    
+    async def to_oracle_data_point(self, asset: str) -> OracleDataPoint:
+        return OracleDataPoint.model_construct(
+            provider=self.provider,
+            data_type=DataCategory.PRICE,
+            value=self.value,
+            timestamp=datetime.now(timezone.utc),
+            confidence=None
+        )
+
+
+class TestAggregatedData:
+    """Test aggregating values across providers"""
+    
+    def make_router(self, chainlink_value, pyth_value):
+        with patch('openoracle.core.router.OracleRoutingEngine', create=True):
+            router = OpenOracleRouter(enable_ai_routing=False)
+        router.providers = {
+            OracleProvider.CHAINLINK: FakeDataProvider(OracleProvider.CHAINLINK, chainlink_value),
+            OracleProvider.PYTH: FakeDataProvider(OracleProvider.PYTH, pyth_value),
+        }
+        return router
+    
+    @pytest.mark.asyncio
+    async def test_numeric_values_use_validated_median(self):
+        """Numeric values aggregate to a validated median with discrepancy flagged"""
+        router = self.make_router(100.0, 120.0)
+        result = await router.get_aggregated_data(DataCategory.PRICE, {'pair': 'BTC/USD'})
+        
+        assert isinstance(result, AggregatedOracleData)
+        assert result.aggregation_method == "median"
+        assert result.aggregated_value == 110.0
+        assert result.discrepancy_detected
+        assert result.confidence == 0.8
+    
+    @pytest.mark.asyncio
+    async def test_non_numeric_values_use_latest(self):
+        """Non-numeric values take the most recent point under a valid method"""
+        router = self.make_router("yes", "no")
+        result = await router.get_aggregated_data(DataCategory.PRICE, {'pair': 'BTC/USD'})
+        
+        assert result.aggregation_method == "latest"
+        assert result.aggregated_value in ("yes", "no")
+        assert result.individual_values == {'chainlink': "yes", 'pyth': "no"}
+    
+    @pytest.mark.asyncio
+    async def test_dict_values_use_latest(self):
+        """Chainlink sports payloads aggregate as a dict under "latest" """
+        router = self.make_router({'home': 24, 'away': 17}, None)
+        result = await router.get_aggregated_data(
+            DataCategory.SPORTS, {'sport': 'NFL', 'game_id': 'g1'}
+        )
+        
+        assert result.aggregation_method == "latest"
+        assert result.aggregated_value == {'home': 24, 'away': 17}
+        assert result.individual_values == {'chainlink': {'home': 24, 'away': 17}}
+
+
+def router_with_pyth() -> OpenOracleRouter:
+    """Router whose only provider is a real Pyth provider"""
+    with patch('openoracle.core.router.OracleRoutingEngine', create=True):
+        router = OpenOracleRouter(enable_ai_routing=False)
+    router.providers = {OracleProvider.PYTH: PythProvider()}
+    return router
+
+
+class TestRouterLifecycle:
+    """Test that closing the router releases provider sessions"""
+    
+    @pytest.mark.asyncio
+    async def test_close_releases_provider_sessions(self):
+        """router.close() closes an open Pyth session"""
+        router = router_with_pyth()
+        pyth = router.providers[OracleProvider.PYTH]
+        await pyth.start()
+        session = pyth._session
+        
+        await router.close()
+        
+        assert session.closed
+    
+    @pytest.mark.asyncio
+    async def test_context_manager_releases_provider_sessions(self):
+        """Leaving the router's async with block closes an open Pyth session"""
+        async with router_with_pyth() as router:
+            pyth = router.providers[OracleProvider.PYTH]
+            await pyth.start()
+            session = pyth._session
+        
+        assert session.closed
@@ -171,8 +171,8 @@ export interface OraclePollData {
 export interface AggregatedOracleData {
   data_type: DataCategory
   providers: OracleProvider[]
-  aggregation_method: 'median' | 'mean' | 'weighted' | 'unanimous'
-  aggregated_value: string | number | boolean
+  aggregation_method: 'median' | 'mean' | 'weighted' | 'unanimous' | 'latest'
+  aggregated_value: string | number | boolean | Record<string, any>
   individual_values: Record<string, any>
   timestamp: string
   confidence: number